@@ -0,0 +1,508 @@
+import math
+from datetime import date
+from statistics import NormalDist
+import numpy as np
+import pandas as pd
+from algorithms import data
+from algorithms.data import HEALTH_INSURANCE, SOCIOECONOMIC_LEVELS
+from algorithms.data_generator import BogotaMedicalGenerator, fake
+from algorithms.sampler import AliasSampler
+
+COLUMNS = [
+    'ID_Paciente', 'Nombre', 'Género', 'Edad', 'Peso (kg)',
+    'Altura (cm)', 'IMC', 'Presión Arterial', 'Síntomas',
+    'Diagnóstico (CIE-10)', 'Enfermedades Crónicas', 'Fecha Consulta',
+    'Hospital', 'Dirección Hospital', 'Localidad',
+    'Nivel Socioeconómico', 'Seguro Médico'
+]
+
+AGE_GROUPS = ['<18', '18-60', '>60']
+BMI_CATEGORIES = ['Underweight', 'Normal', 'Overweight', 'Obese']
+BMI_EDGES = [18.5, 25, 30]
+BMI_BOUNDS = {
+    'Underweight': (-np.inf, 18.5),
+    'Normal':      (18.5, 25),
+    'Overweight':  (25, 30),
+    'Obese':       (30, np.inf),
+}
+MIN_AGE, MAX_AGE = 15, 100
+# Faker's date_between(start_date='-2y') yields 1 to 731 days before today.
+CONSULTATION_DAYS = 731
+ROUTINE_SYMPTOM = 'Chequeo rutinario'
+ROUTINE_DIAGNOSIS = ('Z00.0', 'Examen médico general')
+
+
+def _as_set(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return {value}
+    return set(value)
+
+
+def _check_not_empty(name, values):
+    if values is not None and not values:
+        raise ValueError(f"No {name} allowed: the constraint is an empty collection")
+
+
+def _check_known(name, values, known):
+    if values is None:
+        return
+    _check_not_empty(name, values)
+    unknown = values - set(known)
+    if unknown:
+        raise ValueError(f"Unknown {name}: {sorted(unknown)}")
+
+
+def symptom_table(catalog):
+    # Probability of each symptom, indexed [symptom, age group, BMI category].
+    return np.array([
+        [[data['age_probability'][group] * data.get('bmi_factor', {}).get(category, 1.0)
+          for category in BMI_CATEGORIES]
+         for group in AGE_GROUPS]
+        for data in catalog.values()
+    ])
+
+
+def chronic_table(catalog):
+    # Probability of each chronic disease, indexed [disease, BMI category].
+    return np.array([
+        [params['base_probability'] * params['bmi_multipliers'].get(category, 1.0)
+         for category in BMI_CATEGORIES]
+        for params in catalog.values()
+    ])
+
+
+class CohortSpec:
+    """Constraints describing the cohort to generate.
+
+    Every constraint is optional. Categorical constraints accept a single
+    value or a collection of allowed values; ``diagnoses`` is satisfied when
+    the row's diagnosis code is one of the given codes, while every entry of
+    ``chronic_conditions`` must be present. Diagnosis codes and chronic
+    conditions are checked against the given catalogs (the ``algorithms.data``
+    ones by default), which must be the generator's.
+    """
+
+    def __init__(self, age_range=None, sex=None, bmi_categories=None,
+                 insurance=None, socioeconomic_levels=None, hospitals=None,
+                 districts=None, diagnoses=None, chronic_conditions=None,
+                 symptoms_diagnoses=None, chronic_diseases=None):
+        self.symptoms_diagnoses = symptoms_diagnoses or data.symptoms_diagnoses
+        self.chronic_diseases = chronic_diseases or data.chronic_diseases
+        self.age_range = age_range
+        self.sex = _as_set(sex)
+        self.bmi_categories = _as_set(bmi_categories)
+        self.insurance = _as_set(insurance)
+        self.socioeconomic_levels = _as_set(socioeconomic_levels)
+        self.hospitals = _as_set(hospitals)
+        self.districts = _as_set(districts)
+        self.diagnoses = _as_set(diagnoses)
+        self.chronic_conditions = _as_set(chronic_conditions) or set()
+
+        known_codes = {code for entry in self.symptoms_diagnoses.values()
+                       for code, _ in entry['diagnoses']}
+        known_codes.add(ROUTINE_DIAGNOSIS[0])
+        _check_known('sex', self.sex, ['M', 'F'])
+        _check_known('BMI categories', self.bmi_categories, BMI_CATEGORIES)
+        _check_known('insurance', self.insurance, HEALTH_INSURANCE)
+        _check_known('socioeconomic levels', self.socioeconomic_levels, SOCIOECONOMIC_LEVELS)
+        _check_known('diagnoses', self.diagnoses, known_codes)
+        _check_known('chronic conditions', self.chronic_conditions or None, self.chronic_diseases)
+        _check_not_empty('hospitals', self.hospitals)
+        _check_not_empty('districts', self.districts)
+
+        low, high = self.ages()
+        if low > high:
+            raise ValueError('No age satisfies the age range and chronic conditions')
+        if self.chronic_conditions and self.diagnoses == {ROUTINE_DIAGNOSIS[0]}:
+            raise ValueError('Routine checkups never carry chronic conditions')
+
+    def ages(self):
+        low, high = self.age_range if self.age_range is not None else (MIN_AGE, MAX_AGE)
+        for disease in self.chronic_conditions:
+            low = max(low, self.chronic_diseases[disease]['age_range'][0])
+        return max(low, MIN_AGE), min(high, MAX_AGE)
+
+
+class BatchMedicalGenerator(BogotaMedicalGenerator):
+    """Vectorized generator producing whole batches of patients at once.
+
+    Rows follow the same distributions as ``generate_patient``. When a
+    ``CohortSpec`` is given, each stage samples from its conditional
+    distribution (renormalized categorical weights, an exact discretized
+    truncated normal for age, a truncated uniform for the weight factor
+    that decides the BMI category) and only thins candidates by the exact
+    likelihood ratio for required diagnoses or chronic conditions.
+    """
+
+    def __init__(self, seed=None, facilities=None, symptoms_diagnoses=None, chronic_diseases=None):
+        super().__init__(facilities, symptoms_diagnoses, chronic_diseases)
+        self.rng = np.random.default_rng(seed)
+
+        ages = np.arange(MIN_AGE, MAX_AGE + 1)
+        age_dist = NormalDist(35, 15)
+        cdf = np.array([age_dist.cdf(age) for age in range(MIN_AGE + 1, MAX_AGE + 1)])
+        self.age_values = ages
+        self.age_probabilities = np.diff(np.concatenate(([0.0], cdf, [1.0])))
+
+        self.symptom_probabilities = symptom_table(self.symptoms_diagnoses)
+        self.symptom_labels = np.array(self.symptom_names, dtype=object)
+        self.chronic_labels = np.array(self.chronic_names, dtype=object)
+        # Fixed random keys identify label combinations by an order-free sum.
+        key_rng = np.random.default_rng(0)
+        self.symptom_keys = key_rng.integers(1, 2 ** 63, len(self.symptom_names), dtype=np.uint64)
+        self.chronic_keys = key_rng.integers(1, 2 ** 63, len(self.chronic_names), dtype=np.uint64)
+        self.chronic_min_ages = np.array(
+            [params['age_range'][0] for params in self.chronic_diseases.values()])
+        self.chronic_probabilities = chronic_table(self.chronic_diseases)
+
+        person = fake.provider('faker.providers.person')
+        self.first_name_samplers = {
+            'F': AliasSampler(person.first_names_female.keys(),
+                              person.first_names_female.values()),
+            'M': AliasSampler(person.first_names_male.keys(),
+                              person.first_names_male.values()),
+        }
+        self.last_name_sampler = AliasSampler(person.last_names.keys(),
+                                              person.last_names.values())
+        self.name_formats = {
+            'F': [(fmt.count('{{first_name'), fmt.count('{{last_name'))
+                  for fmt in person.formats_female],
+            'M': [(fmt.count('{{first_name'), fmt.count('{{last_name'))
+                  for fmt in person.formats_male],
+        }
+
+    def generate_cohort(self, n, **constraints):
+        spec = CohortSpec(symptoms_diagnoses=self.symptoms_diagnoses,
+                          chronic_diseases=self.chronic_diseases, **constraints)
+        return pd.DataFrame(self.generate_batch(n, spec), columns=COLUMNS)
+
+    def generate_batch(self, n, spec=None):
+        spec = spec or CohortSpec(symptoms_diagnoses=self.symptoms_diagnoses,
+                                  chronic_diseases=self.chronic_diseases)
+        for catalog in ('symptoms_diagnoses', 'chronic_diseases'):
+            if getattr(spec, catalog) is not getattr(self, catalog) \
+                    and getattr(spec, catalog) != getattr(self, catalog):
+                raise ValueError(f"The cohort spec was built for a different {catalog} catalog")
+        clinical = self._sample_clinical(n, spec)
+        age, bmi = clinical['age'], clinical['bmi']
+        gender = np.where(clinical['is_female'], 'F', 'M').astype(object)
+
+        facilities = self.facilities
+        if spec.hospitals is not None or spec.districts is not None:
+            facilities = facilities.subset(spec.hospitals, spec.districts)
+        levels, insurance = self._sample_levels_and_insurance(n, spec, facilities)
+        facility = facilities.sample_indices(n, self.rng, levels, insurance)
+
+        return {
+            'ID_Paciente': np.char.mod('%08x', self.rng.integers(0, 2 ** 32, n)).astype(object),
+            'Nombre': self._sample_names(clinical['is_female']),
+            'Género': gender,
+            'Edad': age,
+            'Peso (kg)': np.round(clinical['weight'], 1),
+            'Altura (cm)': clinical['height'].astype(np.int64),
+            'IMC': np.round(bmi, 1),
+            'Presión Arterial': self._sample_blood_pressure(age, bmi),
+            'Síntomas': clinical['symptoms'],
+            'Diagnóstico (CIE-10)': clinical['diagnosis'],
+            'Enfermedades Crónicas': clinical['chronic'],
+            'Fecha Consulta': self._sample_dates(n),
+            'Hospital': facilities.names[facility],
+            'Dirección Hospital': facilities.addresses[facility],
+            'Localidad': facilities.districts[facility],
+            'Nivel Socioeconómico': levels,
+            'Seguro Médico': insurance,
+        }
+
+    def _sample_levels_and_insurance(self, n, spec, facilities):
+        level_sampler = self._restricted_sampler(SOCIOECONOMIC_LEVELS, spec.socioeconomic_levels)
+        insurance_sampler = self._restricted_sampler(HEALTH_INSURANCE, spec.insurance)
+        if facilities is self.facilities or not facilities.conditional:
+            return (level_sampler.sample_many(n, self.rng),
+                    insurance_sampler.sample_many(n, self.rng))
+
+        # When facilities depend on level/insurance, restricting the hospitals
+        # reweights each (level, insurance) pair by the share of facility
+        # weight the allowed hospitals keep under that pair.
+        pairs, weights = [], []
+        for level, level_p in zip(level_sampler.population, level_sampler.probabilities):
+            for plan, plan_p in zip(insurance_sampler.population, insurance_sampler.probabilities):
+                kept = facilities.conditional_weights(level, plan).sum()
+                total = self.facilities.conditional_weights(level, plan).sum()
+                pairs.append((level, plan))
+                weights.append(level_p * plan_p * kept / total if total else 0.0)
+        if not any(weights):
+            raise ValueError('No allowed hospital serves any allowed socioeconomic level '
+                             'and insurance pair')
+        chosen = AliasSampler(pairs, weights).sample_indices(n, self.rng)
+        return (np.array([pair[0] for pair in pairs], dtype=object)[chosen],
+                np.array([pair[1] for pair in pairs], dtype=object)[chosen])
+
+    def _restricted_sampler(self, weights, allowed):
+        if allowed is None:
+            return AliasSampler(weights.keys(), weights.values())
+        kept = [value for value in weights if value in allowed]
+        return AliasSampler(kept, [weights[value] for value in kept])
+
+    def _sample_clinical(self, n, spec):
+        parts = []
+        accepted = 0
+        size = n
+        drawn = 0
+        while accepted < n:
+            candidates = self._sample_candidates(size, spec)
+            kept = int(candidates['accept'].sum())
+            drawn += size
+            if kept:
+                parts.append({key: value[candidates['accept']]
+                              for key, value in candidates.items()})
+                accepted += kept
+            elif drawn > 1000 * n + 1_000_000:
+                raise ValueError('The requested cohort has (almost) zero probability')
+            rate = max(accepted / drawn, 1e-3)
+            size = int(math.ceil((n - accepted) / rate * 1.1)) + 16
+
+        if not parts:
+            parts.append(self._sample_candidates(0, spec))
+        return {key: np.concatenate([part[key] for part in parts])[:n]
+                for key in parts[0]}
+
+    def _sample_candidates(self, m, spec):
+        rng = self.rng
+        sexes = sorted(spec.sex) if spec.sex is not None else ['F', 'M']
+        is_female = np.array([sex == 'F' for sex in sexes])[rng.integers(0, len(sexes), m)]
+        age = self._sample_ages(m, *spec.ages())
+        height = self._sample_heights(age, is_female)
+        weight, bmi, accept = self._sample_weights(age, is_female, height, spec.bmi_categories)
+
+        age_group = np.digitize(age, [18, 61])
+        bmi_idx = np.digitize(bmi, BMI_EDGES)
+
+        # Symptoms and chronic conditions are kept as sorted (row, entry)
+        # pairs of the positives, so their cost follows the expected number of
+        # positives rather than the catalog size.
+        symptom_rows, symptoms = self._sparse_draw(
+            age_group * len(BMI_CATEGORIES) + bmi_idx,
+            lambda code: self.symptom_samplers[(AGE_GROUPS[code // len(BMI_CATEGORIES)],
+                                                BMI_CATEGORIES[code % len(BMI_CATEGORIES)])])
+        has_symptoms = np.bincount(symptom_rows, minlength=m) > 0
+        diagnosis, accept_dx = self._sample_diagnoses(symptom_rows, symptoms, m, spec.diagnoses)
+        accept &= accept_dx
+
+        bands = len(self.chronic_ages) + 1
+        chronic_rows, chronic = self._sparse_draw(
+            bmi_idx * bands + np.searchsorted(self.chronic_ages, age, side='right'),
+            lambda code: self.chronic_sampler(BMI_CATEGORIES[code // bands], code % bands))
+        if spec.chronic_conditions:
+            required = [self.chronic_names.index(name) for name in spec.chronic_conditions]
+            chronic_p = np.minimum(self.chronic_probabilities[required][:, bmi_idx].T, 1.0)
+            chronic_p = chronic_p * (age[:, None] >= self.chronic_min_ages[required])
+            likelihood = chronic_p.prod(axis=1) * has_symptoms
+            allowed_bmi = [BMI_CATEGORIES.index(c) for c in spec.bmi_categories or BMI_CATEGORIES]
+            bound = np.minimum(
+                self.chronic_probabilities[np.ix_(required, allowed_bmi)], 1.0).prod(axis=0).max()
+            accept &= rng.random(m) * bound < likelihood
+            pairs = np.unique(np.concatenate((
+                chronic_rows * len(self.chronic_names) + chronic,
+                np.arange(m).repeat(len(required)) * len(self.chronic_names)
+                + np.tile(required, m))))
+            chronic_rows, chronic = np.divmod(pairs, len(self.chronic_names))
+        routine = ~has_symptoms[chronic_rows]
+        chronic_rows, chronic = chronic_rows[~routine], chronic[~routine]
+
+        return {
+            'accept': accept,
+            'is_female': is_female,
+            'age': age,
+            'height': height,
+            'weight': weight,
+            'bmi': bmi,
+            'symptoms': self._join_labels(symptom_rows, symptoms, m, self.symptom_labels,
+                                          self.symptom_keys, ROUTINE_SYMPTOM),
+            'chronic': self._join_labels(chronic_rows, chronic, m, self.chronic_labels,
+                                         self.chronic_keys, 'Ninguna'),
+            'diagnosis': diagnosis,
+        }
+
+    def _sample_ages(self, m, low, high):
+        window = (self.age_values >= low) & (self.age_values <= high)
+        sampler = AliasSampler(self.age_values[window], self.age_probabilities[window])
+        return self.age_values[window][sampler.sample_indices(m, self.rng)]
+
+    def _sample_heights(self, age, is_female):
+        mean = np.where(is_female, 158.0, 171.0)
+        std = np.full(len(age), 9.0)
+        low = np.full(len(age), 145.0)
+        high = np.full(len(age), 200.0)
+
+        minor = age < 18
+        mean[minor] -= 8
+        low[minor], high[minor] = 140.0, 185.0
+        std[(age >= 18) & (age <= 40)] *= 0.8
+        std[age > 40] *= 0.6
+        mean[age > 60] -= 2
+
+        height = np.clip(self.rng.normal(mean, std), low, high)
+        return np.round(height, 1)
+
+    def _sample_weights(self, age, is_female, height, bmi_categories):
+        rng = self.rng
+        m = len(age)
+        factor = np.ones(m)
+        minor, elder = age < 18, age > 60
+        factor[minor] = rng.normal(0.9, 0.2, minor.sum())
+        factor[elder] = rng.normal(0.85, 0.15, elder.sum())
+        factor *= np.where(is_female, rng.normal(0.9, 0.2, m), rng.normal(1.1, 0.2, m))
+        scale = (height - 100) * factor
+        squared_height = (height / 100) ** 2
+
+        if bmi_categories is None:
+            weight = np.round(scale * rng.uniform(0.90, 1.10, m), 1)
+            return weight, weight / squared_height, np.ones(m, dtype=bool)
+
+        # The weight is linear in the final uniform factor, so each allowed
+        # BMI category maps to an interval of that factor. Drawing the factor
+        # inside the union of intervals, and keeping the row with probability
+        # equal to the union's share of [0.9, 1.1], is exact conditioning.
+        categories = sorted(bmi_categories, key=BMI_CATEGORIES.index)
+        lows, highs = [], []
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for category in categories:
+                bmi_low, bmi_high = BMI_BOUNDS[category]
+                a = bmi_low * squared_height / scale
+                b = bmi_high * squared_height / scale
+                lo = np.clip(np.nan_to_num(np.minimum(a, b), nan=1.10), 0.90, 1.10)
+                hi = np.clip(np.nan_to_num(np.maximum(a, b), nan=0.90), 0.90, 1.10)
+                lows.append(lo)
+                highs.append(np.maximum(hi, lo))
+        lows, highs = np.array(lows), np.array(highs)
+        lengths = highs - lows
+        total = lengths.sum(axis=0)
+
+        u = rng.random(m) * total
+        chosen = (np.cumsum(lengths, axis=0) <= u).sum(axis=0)
+        chosen = np.minimum(chosen, len(categories) - 1)
+        offset = u - np.concatenate((np.zeros((1, m)), np.cumsum(lengths, axis=0)[:-1]))[chosen, np.arange(m)]
+        uniform_factor = lows[chosen, np.arange(m)] + offset
+
+        accept = rng.random(m) * 0.2 < total
+        weight = np.round(scale * uniform_factor, 1)
+        bmi = weight / squared_height
+        # Rounding the weight can push a row just across a category edge.
+        in_category = np.isin(np.digitize(bmi, BMI_EDGES),
+                              [BMI_CATEGORIES.index(c) for c in categories])
+        return weight, bmi, accept & in_category
+
+    def _sparse_draw(self, groups, sampler_for):
+        # Draws every row with the Bernoulli sampler of its group code and
+        # returns the positives as (row, entry) pairs sorted by row and entry.
+        rows, entries = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+        for code in np.unique(groups):
+            members = np.flatnonzero(groups == code)
+            member_rows, member_entries = sampler_for(int(code)).sample_many(len(members), self.rng)
+            rows.append(members[member_rows])
+            entries.append(member_entries)
+        rows, entries = np.concatenate(rows), np.concatenate(entries)
+        order = np.lexsort((entries, rows))
+        return rows[order], entries[order]
+
+    def _sample_diagnoses(self, rows, entries, m, diagnoses):
+        rng = self.rng
+        k = len(self.symptom_names)
+        counts = np.bincount(rows, minlength=m)
+        has_symptoms = counts > 0
+        routine_allowed = diagnoses is None or ROUTINE_DIAGNOSIS[0] in diagnoses
+
+        samplers = self.diagnosis_samplers
+        if diagnoses is None:
+            symptom_weights = np.ones(len(entries))
+            accept = np.ones(m, dtype=bool)
+        else:
+            samplers, share = {}, np.zeros(k)
+            for i, symptom in enumerate(self.symptom_names):
+                full = self.diagnosis_samplers[symptom]
+                kept = [j for j, (code, _) in enumerate(full.population) if code in diagnoses]
+                if kept:
+                    share[i] = full.probabilities[kept].sum()
+                    samplers[symptom] = AliasSampler(
+                        [full.population[j] for j in kept], full.probabilities[kept])
+            symptom_weights = share[entries]
+            likelihood = np.where(
+                has_symptoms,
+                np.bincount(rows, symptom_weights, minlength=m) / np.maximum(counts, 1),
+                float(routine_allowed))
+            bound = max(share.max(), float(routine_allowed))
+            accept = rng.random(m) * bound < likelihood
+
+        # Exponential race: picks each present symptom with probability
+        # proportional to its weight (uniform when unconstrained).
+        with np.errstate(divide='ignore'):
+            keys = -np.log(rng.random(len(entries))) / symptom_weights
+        order = np.lexsort((keys, rows))
+        first = order[np.flatnonzero(np.diff(rows[order], prepend=-1))]
+        main_rows, main = rows[first], entries[first]
+
+        labels = np.empty(m, dtype=object)
+        labels[:] = f"{ROUTINE_DIAGNOSIS[0]} - {ROUTINE_DIAGNOSIS[1]}"
+        by_symptom = np.argsort(main, kind='stable')
+        symptoms, starts = np.unique(main[by_symptom], return_index=True)
+        for i, group in zip(symptoms, np.split(by_symptom, starts[1:])):
+            symptom = self.symptom_names[i]
+            if symptom not in samplers:
+                continue
+            sampler = samplers[symptom]
+            names = np.array([f"{code} - {name}" for code, name in sampler.population], dtype=object)
+            labels[main_rows[group]] = names[sampler.sample_indices(len(group), rng)]
+        return labels, accept
+
+    def _sample_blood_pressure(self, age, bmi):
+        n = len(age)
+        systolic = np.clip(self.rng.normal(110 + age / 30 + bmi / 2, 8, n), 90, 180)
+        diastolic = np.clip(self.rng.normal(70 + age / 40 + bmi / 4, 5, n), 60, 120)
+        return np.array(
+            [f"{s}/{d} mmHg" for s, d in zip(systolic.astype(np.int64).tolist(),
+                                              diastolic.astype(np.int64).tolist())],
+            dtype=object)
+
+    def _sample_names(self, is_female):
+        n = len(is_female)
+        names = np.empty(n, dtype=object)
+        for sex, mask in (('F', is_female), ('M', ~is_female)):
+            rows = np.flatnonzero(mask)
+            count = len(rows)
+            if count == 0:
+                continue
+            formats = self.name_formats[sex]
+            chosen = self.rng.integers(0, len(formats), count)
+            firsts = [self.first_name_samplers[sex].sample_many(count, self.rng) for _ in range(2)]
+            lasts = [self.last_name_sampler.sample_many(count, self.rng) for _ in range(2)]
+            result = np.empty(count, dtype=object)
+            for i, (n_first, n_last) in enumerate(formats):
+                parts = firsts[:n_first] + lasts[:n_last]
+                full = parts[0]
+                for part in parts[1:]:
+                    full = full + ' ' + part
+                result[chosen == i] = full[chosen == i]
+            names[rows] = result
+        return names
+
+    def _sample_dates(self, n):
+        today = np.datetime64(date.today(), 'D')
+        return today - self.rng.integers(1, CONSULTATION_DAYS + 1, n)
+
+    @staticmethod
+    def _join_labels(rows, entries, m, labels, keys, empty):
+        # Rows with the same set of entries share one joined string; sets are
+        # told apart by the wrapping sum of a random 64-bit key per entry.
+        combination = np.zeros(m, dtype=np.uint64)
+        np.add.at(combination, rows, keys[entries])
+        _, representative, inverse = np.unique(
+            combination, return_index=True, return_inverse=True)
+        starts = np.searchsorted(rows, representative)
+        stops = np.searchsorted(rows, representative, side='right')
+        joined = np.array([
+            ', '.join(labels[entries[start:stop]]) or empty
+            for start, stop in zip(starts.tolist(), stops.tolist())
+        ], dtype=object)
+        return joined[inverse.reshape(-1)]
@@ -0,0 +1,190 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from algorithms.batch_generator import BatchMedicalGenerator, COLUMNS
+
+OUTPUT_FORMATS = ('numpy', 'pandas', 'arrow')
+BLOCK_SIZE = 4096
+
+
+def to_arrow(columns):
+    try:
+        import pyarrow as pa
+    except ImportError as error:
+        raise ImportError("Arrow output requires the 'pyarrow' package") from error
+    return pa.RecordBatch.from_arrays(
+        [pa.array(values) for values in columns.values()], names=list(columns))
+
+
+def concat_columns(parts):
+    if not parts:
+        columns = {'#Fila': np.empty(0, dtype=np.int64)}
+        columns.update({column: np.empty(0, dtype=object) for column in COLUMNS})
+        return columns
+    return {column: np.concatenate([part[column] for part in parts]) for column in parts[0]}
+
+
+class BlockStream:
+    """Deterministic row stream built from fixed-size, independently seeded blocks.
+
+    Block ``i`` always holds rows ``[i * BLOCK_SIZE, (i + 1) * BLOCK_SIZE)`` and is
+    generated from a seed derived from ``seed`` and ``i`` only, so any row range
+    comes out identical regardless of how the stream is chunked or how many
+    workers produce it.
+    """
+
+    def __init__(self, seed=None, spec=None, facilities=None,
+                 symptoms_diagnoses=None, chronic_diseases=None):
+        self.seed = np.random.SeedSequence(seed).entropy
+        self.spec = spec
+        self.generator = BatchMedicalGenerator(facilities=facilities,
+                                               symptoms_diagnoses=symptoms_diagnoses,
+                                               chronic_diseases=chronic_diseases)
+        self._cached = (None, None)
+
+    def block(self, index):
+        if self._cached[0] == index:
+            return self._cached[1]
+        self.generator.rng = np.random.default_rng(
+            np.random.SeedSequence(self.seed, spawn_key=(index,)))
+        columns = {'#Fila': np.arange(1, BLOCK_SIZE + 1) + index * BLOCK_SIZE}
+        columns.update(self.generator.generate_batch(BLOCK_SIZE, self.spec))
+        self._cached = (index, columns)
+        return columns
+
+    def rows(self, start, stop):
+        parts = []
+        for index in range(start // BLOCK_SIZE, -(-stop // BLOCK_SIZE)):
+            offset = index * BLOCK_SIZE
+            low, high = max(start - offset, 0), min(stop - offset, BLOCK_SIZE)
+            parts.append({column: values[low:high]
+                          for column, values in self.block(index).items()})
+        return concat_columns(parts)
+
+
+def _generate_chunk(seed, spec, facilities, symptoms_diagnoses, chronic_diseases, start, stop):
+    return BlockStream(seed, spec, facilities, symptoms_diagnoses, chronic_diseases).rows(start, stop)
+
+
+def generate_parallel(rows, seed, spec=None, workers=1, chunk_size=BLOCK_SIZE * 8,
+                      facilities=None, symptoms_diagnoses=None, chronic_diseases=None):
+    """Generates ``rows`` patients of the block stream using ``workers`` processes.
+
+    The result only depends on ``seed`` and ``spec``: worker count and chunk
+    size change how the work is split, not the rows produced.
+    """
+    seed = np.random.SeedSequence(seed).entropy
+    bounds = [(start, min(start + chunk_size, rows)) for start in range(0, rows, chunk_size)]
+    if workers <= 1:
+        stream = BlockStream(seed, spec, facilities, symptoms_diagnoses, chronic_diseases)
+        parts = [stream.rows(start, stop) for start, stop in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(
+                _generate_chunk, [seed] * len(bounds), [spec] * len(bounds),
+                [facilities] * len(bounds), [symptoms_diagnoses] * len(bounds),
+                [chronic_diseases] * len(bounds), *zip(*bounds)))
+    return concat_columns(parts)
+
+
+class PatientBatchIterator:
+    """Endless (or bounded) stream of fixed-size patient batches.
+
+    The stream stops after ``num_batches`` batches or ``num_rows`` rows (the
+    last batch is then shorter), whichever comes first.
+
+    Batches are slices of a ``BlockStream``, so ``seek`` jumps straight to any
+    batch and the rows are identical no matter how the stream is consumed or
+    which batch size is used. With ``prefetch > 0`` the next batches are
+    generated in a background worker while the caller works on the current one.
+    An optional ``Corruptor`` dirties each batch before it is handed out and
+    records its ground truth as the batch is consumed.
+    """
+
+    def __init__(self, batch_size, num_batches=None, output='numpy', seed=None,
+                 spec=None, prefetch=1, corruptor=None, num_rows=None, facilities=None,
+                 symptoms_diagnoses=None, chronic_diseases=None):
+        if batch_size <= 0:
+            raise ValueError('batch_size must be positive')
+        if output not in OUTPUT_FORMATS:
+            raise ValueError(f"output must be one of {OUTPUT_FORMATS}")
+        self.batch_size = batch_size
+        if num_rows is not None:
+            batches_for_rows = -(-num_rows // batch_size)
+            num_batches = batches_for_rows if num_batches is None else min(num_batches, batches_for_rows)
+        self.num_batches = num_batches
+        self.num_rows = num_rows
+        self.output = output
+        self.stream = BlockStream(seed, spec, facilities, symptoms_diagnoses, chronic_diseases)
+        self.corruptor = corruptor
+        self.prefetch = prefetch
+        self.position = 0
+        self._pending = deque()
+        self._executor = ThreadPoolExecutor(max_workers=1) if prefetch > 0 else None
+
+    def generate(self, batch_index):
+        start = batch_index * self.batch_size
+        stop = start + self.batch_size
+        if self.num_rows is not None:
+            stop = min(stop, self.num_rows)
+        columns = self.stream.rows(start, stop)
+        if self.corruptor is None:
+            return columns, None
+        return self.corruptor.apply(columns, self.corruptor.rng_for(batch_index))
+
+    def convert(self, columns):
+        if self.output == 'pandas':
+            return pd.DataFrame(columns, columns=['#Fila'] + COLUMNS)
+        if self.output == 'arrow':
+            return to_arrow(columns)
+        return columns
+
+    def seek(self, batch_index):
+        if batch_index < 0:
+            raise ValueError('batch_index must be non-negative')
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self.position = batch_index
+
+    def _schedule(self):
+        next_index = self._pending[-1][0] + 1 if self._pending else self.position
+        while len(self._pending) < self.prefetch + 1 and not self._exhausted(next_index):
+            self._pending.append(
+                (next_index, self._executor.submit(self.generate, next_index)))
+            next_index += 1
+
+    def _exhausted(self, batch_index):
+        return self.num_batches is not None and batch_index >= self.num_batches
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._exhausted(self.position):
+            raise StopIteration
+        if self._executor is None:
+            columns, truth = self.generate(self.position)
+        else:
+            self._schedule()
+            _, future = self._pending.popleft()
+            columns, truth = future.result()
+        if truth is not None:
+            self.corruptor.record(truth, self.position)
+        self.position += 1
+        if self._executor is not None:
+            self._schedule()
+        return self.convert(columns)
+
+    def close(self):
+        if self._executor is not None:
+            self.seek(self.position)
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1 +1,2 @@
-ROW_NUMBER=1000000
\ No newline at end of file
+ROW_NUMBER=1000000
+BATCH_SIZE=100000
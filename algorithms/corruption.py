@@ -0,0 +1,177 @@
+import numpy as np
+import pandas as pd
+from algorithms.batch_generator import COLUMNS
+
+TRUTH_COLUMNS = ['#Fila', 'Columna', 'Error', 'Valor Original']
+
+
+class Corruptor:
+    """Injects realistic data-quality errors into generated batches.
+
+    Every error type has its own rate (share of rows affected). Edits are
+    applied with row masks on whole columns, a cell is corrupted at most
+    once, and each edit is reported in a ground-truth table with the row's
+    ``#Fila``, the column, the error type and the original value. Duplicated
+    patients are appended at the end of the batch with the same ``#Fila``
+    as the row they copy.
+
+    The ``ground_truth`` file is rewritten by the first ``record`` of each
+    ``Corruptor``, and a batch index already recorded is not written again.
+    """
+
+    def __init__(self, missing=None, name_typos=0.0, swapped_dates=0.0,
+                 weight_units=0.0, height_units=0.0, blood_pressure=0.0,
+                 duplicates=0.0, seed=None, ground_truth=None):
+        self.missing = missing or {}
+        unknown = set(self.missing) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"Cannot blank unknown columns {sorted(unknown)}; use {COLUMNS}")
+        rates = {'name_typos': name_typos, 'swapped_dates': swapped_dates,
+                 'weight_units': weight_units, 'height_units': height_units,
+                 'blood_pressure': blood_pressure, 'duplicates': duplicates}
+        rates.update({f"missing[{column!r}]": rate for column, rate in self.missing.items()})
+        invalid = {name: rate for name, rate in rates.items() if not 0 <= rate <= 1}
+        if invalid:
+            raise ValueError(f"Error rates must be between 0 and 1: {invalid}")
+        self.name_typos = name_typos
+        self.swapped_dates = swapped_dates
+        self.weight_units = weight_units
+        self.height_units = height_units
+        self.blood_pressure = blood_pressure
+        self.duplicates = duplicates
+        self.seed = np.random.SeedSequence(seed).entropy
+        self.ground_truth = ground_truth
+        self._recorded = set()
+        self._started = False
+
+    def rng_for(self, batch_index):
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(batch_index,)))
+
+    def apply(self, columns, rng):
+        n = len(columns['#Fila'])
+        columns = dict(columns)
+        truth = []
+        touched = {}
+
+        def select(column, rate, eligible=None):
+            mask = rng.random(n) < rate
+            if eligible is not None:
+                mask &= eligible
+            mask &= ~touched.get(column, np.zeros(n, dtype=bool))
+            touched[column] = touched.get(column, np.zeros(n, dtype=bool)) | mask
+            return np.flatnonzero(mask)
+
+        def log(rows, column, error):
+            truth.append(pd.DataFrame({
+                '#Fila': columns['#Fila'][rows],
+                'Columna': column,
+                'Error': error,
+                'Valor Original': columns[column][rows],
+            }))
+
+        if self.name_typos:
+            rows = select('Nombre', self.name_typos)
+            log(rows, 'Nombre', 'error_tipografico')
+            names = columns['Nombre'].copy()
+            names[rows] = self._typos(names[rows], rng)
+            columns['Nombre'] = names
+
+        if self.swapped_dates:
+            dates = columns['Fecha Consulta'].astype('datetime64[D]')
+            years = dates.astype('datetime64[Y]')
+            months = dates.astype('datetime64[M]')
+            day = (dates - months).astype(np.int64) + 1
+            month = (months - years).astype(np.int64) + 1
+            rows = select('Fecha Consulta', self.swapped_dates, (day <= 12) & (day != month))
+            log(rows, 'Fecha Consulta', 'dia_mes_invertidos')
+            swapped = dates.copy()
+            swapped[rows] = (years[rows].astype('datetime64[M]') + (day[rows] - 1)
+                             ).astype('datetime64[D]') + (month[rows] - 1)
+            columns['Fecha Consulta'] = swapped
+
+        if self.weight_units:
+            rows = select('Peso (kg)', self.weight_units)
+            log(rows, 'Peso (kg)', 'unidades_libras')
+            weight = columns['Peso (kg)'].astype(float)
+            weight[rows] = np.round(weight[rows] * 2.20462, 1)
+            columns['Peso (kg)'] = weight
+
+        if self.height_units:
+            rows = select('Altura (cm)', self.height_units)
+            log(rows, 'Altura (cm)', 'unidades_metros')
+            height = columns['Altura (cm)'].astype(float)
+            height[rows] = height[rows] / 100
+            columns['Altura (cm)'] = height
+
+        if self.blood_pressure:
+            rows = select('Presión Arterial', self.blood_pressure)
+            log(rows, 'Presión Arterial', 'fuera_de_rango')
+            systolic = rng.integers(181, 301, len(rows))
+            diastolic = rng.integers(20, 60, len(rows))
+            pressure = columns['Presión Arterial'].copy()
+            pressure[rows] = [f"{s}/{d} mmHg" for s, d in zip(systolic.tolist(), diastolic.tolist())]
+            columns['Presión Arterial'] = pressure
+
+        for column, rate in self.missing.items():
+            rows = select(column, rate)
+            log(rows, column, 'faltante')
+            values = columns[column]
+            if np.issubdtype(values.dtype, np.datetime64):
+                values = values.copy()
+                values[rows] = np.datetime64('NaT')
+            elif np.issubdtype(values.dtype, np.number):
+                values = values.astype(float)
+                values[rows] = np.nan
+            else:
+                values = values.astype(object)
+                values[rows] = None
+            columns[column] = values
+
+        if self.duplicates:
+            rows = np.flatnonzero(rng.random(n) < self.duplicates)
+            truth.append(pd.DataFrame({
+                '#Fila': columns['#Fila'][rows],
+                'Columna': '*',
+                'Error': 'paciente_duplicado',
+                'Valor Original': None,
+            }))
+            columns = {column: np.concatenate((values, values[rows]))
+                       for column, values in columns.items()}
+
+        truth = (pd.concat(truth, ignore_index=True) if truth
+                 else pd.DataFrame(columns=TRUTH_COLUMNS))
+        return columns, truth
+
+    @staticmethod
+    def _typos(names, rng):
+        # One random edit per name: swap, drop, repeat or replace a letter.
+        operations = rng.integers(0, 4, len(names))
+        positions = rng.random(len(names))
+        letters = rng.choice(list('abcdefghijklmnopqrstuvwxyz'), len(names))
+        result = []
+        for name, operation, position, letter in zip(names, operations, positions, letters):
+            i = int(position * (len(name) - 1))
+            if operation == 0:
+                typo = name[:i] + name[i + 1:i + 2] + name[i] + name[i + 2:]
+            elif operation == 2:
+                typo = name[:i] + name[i] + name[i:]
+            elif operation == 3:
+                typo = name[:i] + letter + name[i + 1:]
+            if operation == 1 or typo == name:
+                # Swapping equal letters or replacing a letter by itself is
+                # not an error; dropping the letter always is.
+                typo = name[:i] + name[i + 1:]
+            result.append(typo)
+        return result
+
+    def record(self, truth, batch_index=None):
+        if self.ground_truth is None or batch_index in self._recorded:
+            return
+        if batch_index is not None:
+            self._recorded.add(batch_index)
+        if not self._started:
+            self._started = True
+            # Start a fresh file so stale rows from an earlier run never mix in.
+            truth.reindex(columns=TRUTH_COLUMNS).to_csv(self.ground_truth, index=False)
+        elif not truth.empty:
+            truth.to_csv(self.ground_truth, mode='a', header=False, index=False)
@@ -6,6 +6,22 @@ HOSPITALS_BOGOTA = {
     'Clínica Bogotá': {'address': 'Calle 63 #24-09', 'district': 'Kennedy'}
 }
 
+HEALTH_INSURANCE = {
+    'SISBÉN':      0.42,
+    'EPS Sura':    0.15,
+    'Sanitas':     0.12,
+    'Nueva EPS':   0.18,
+    'Salud Total': 0.07,
+    'Coomeva':     0.04,
+    'Particular':  0.02,
+}
+
+SOCIOECONOMIC_LEVELS = {
+    'Bajo':  0.55,
+    'Medio': 0.35,
+    'Alto':  0.10,
+}
+
 symptoms_diagnoses = {
     'Fiebre': {
         'diagnoses': [
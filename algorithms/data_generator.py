@@ -1,12 +1,52 @@
 import random
+from bisect import bisect_right
 from faker import Faker
 import numpy as np
-from algorithms.data import symptoms_diagnoses, chronic_diseases, HOSPITALS_BOGOTA
+from algorithms import data
+from algorithms.data import HEALTH_INSURANCE, SOCIOECONOMIC_LEVELS
+from algorithms.facilities import FacilityCatalog
+from algorithms.sampler import AliasSampler, BernoulliSampler
 
 fake = Faker('es_CO')  
 random.seed(42)
 
 class BogotaMedicalGenerator:      
+    def __init__(self, facilities=None, symptoms_diagnoses=None, chronic_diseases=None):
+        self.symptoms_diagnoses = symptoms_diagnoses or data.symptoms_diagnoses
+        self.chronic_diseases = chronic_diseases or data.chronic_diseases
+        self.gender_sampler = AliasSampler(['M', 'F'])
+        self.facilities = facilities or FacilityCatalog.from_dict()
+        self.insurance_sampler = AliasSampler(
+            HEALTH_INSURANCE.keys(), HEALTH_INSURANCE.values())
+        self.socioeconomic_sampler = AliasSampler(
+            SOCIOECONOMIC_LEVELS.keys(), SOCIOECONOMIC_LEVELS.values())
+        self.diagnosis_samplers = {
+            symptom: self.build_diagnosis_sampler(entry)
+            for symptom, entry in self.symptoms_diagnoses.items()
+        }
+        self.symptom_names = list(self.symptoms_diagnoses)
+        self.symptom_samplers = {
+            (age_group, bmi_category): BernoulliSampler(
+                entry['age_probability'][age_group] * entry.get('bmi_factor', {}).get(bmi_category, 1.0)
+                for entry in self.symptoms_diagnoses.values())
+            for age_group in ('<18', '18-60', '>60')
+            for bmi_category in ('Underweight', 'Normal', 'Overweight', 'Obese')
+        }
+        self.chronic_names = list(self.chronic_diseases)
+        self.chronic_ages = sorted({params['age_range'][0]
+                                    for params in self.chronic_diseases.values()})
+        self.chronic_samplers = {}
+
+    def build_diagnosis_sampler(self, data):
+        diagnoses = data['diagnoses']
+        weights = None
+        if 'bmi_diagnosis_weights' in data:
+            weights = [
+                data['bmi_diagnosis_weights'].get(code, 1.0)
+                for code, _ in diagnoses
+            ]
+        return AliasSampler(diagnoses, weights)
+
     def generate_height(self,age,gender):
         if gender == 'M':
             mean_height = 171
@@ -66,14 +106,8 @@ class BogotaMedicalGenerator:
     def generate_symptoms_diagnosis(self, age, bmi):
         bmi_category = self.get_bmi_category(bmi)
         age_group = '<18' if age < 18 else '18-60' if age <=60 else '>60'
-        symptoms = []
-        for symptom, data in symptoms_diagnoses.items():
-            base_prob = data['age_probability'][age_group]
-            bmi_factor = data.get('bmi_factor', {}).get(bmi_category, 1.0)
-            adjusted_prob = base_prob * bmi_factor
-            
-            if random.random() < adjusted_prob:
-                symptoms.append(symptom)
+        sampler = self.symptom_samplers[(age_group, bmi_category)]
+        symptoms = [self.symptom_names[i] for i in sampler.sample()]
 
         if not symptoms:
             return (
@@ -83,17 +117,7 @@ class BogotaMedicalGenerator:
             )
 
         main_symptom = random.choice(symptoms)
-        diagnoses = symptoms_diagnoses[main_symptom]['diagnoses']
-        
-        if 'bmi_diagnosis_weights' in symptoms_diagnoses[main_symptom]:
-            weights = [
-                symptoms_diagnoses[main_symptom]['bmi_diagnosis_weights'].get(
-                    code[0], 1.0
-                ) for code, _ in diagnoses
-            ]
-            selected_diagnosis = random.choices(diagnoses, weights=weights, k=1)[0]
-        else:
-            selected_diagnosis = random.choice(diagnoses)
+        selected_diagnosis = self.diagnosis_samplers[main_symptom].sample()
 
         return (
             symptoms,
@@ -102,35 +126,30 @@ class BogotaMedicalGenerator:
         )
 
     def generate_chronic_conditions(self, age, bmi):
-        bmi_category = self.get_bmi_category(bmi)
-        chronic = []
-        for disease, params in chronic_diseases.items():
-            if age >= params['age_range'][0]:
-                base_prob = params['base_probability']
-                bmi_multiplier = params['bmi_multipliers'].get(bmi_category, 1.0)
-                if random.random() < (base_prob * bmi_multiplier):
-                    chronic.append(disease)
-        return chronic
+        sampler = self.chronic_sampler(self.get_bmi_category(bmi), bisect_right(self.chronic_ages, age))
+        return [self.chronic_names[i] for i in sampler.sample()]
+
+    def chronic_sampler(self, bmi_category, band):
+        # Diseases become possible at their minimum age, so the eligible set
+        # only changes at those ages: one sampler per age band and BMI category,
+        # where ``band`` counts the minimum ages already reached.
+        key = (bmi_category, band)
+        if key not in self.chronic_samplers:
+            oldest = self.chronic_ages[band - 1] if band else -1
+            self.chronic_samplers[key] = BernoulliSampler(
+                params['base_probability'] * params['bmi_multipliers'].get(bmi_category, 1.0)
+                if params['age_range'][0] <= oldest else 0.0
+                for params in self.chronic_diseases.values())
+        return self.chronic_samplers[key]
 
     def generate_health_insurance(self):
-        return random.choices(population=[
-            'SISBÉN', 
-            'EPS Sura', 
-            'Sanitas', 
-            'Nueva EPS', 
-            'Salud Total', 
-            'Coomeva', 
-            'Particular'],
-            weights=[0.42, 0.15, 0.12, 0.18, 0.07, 0.04, 0.02], 
-            k=1)[0]
+        return self.insurance_sampler.sample()
     
     def generate_socioeconomic_level(self):
-        return random.choices(population=['Bajo', 'Medio', 'Alto'],
-            weights=[0.55, 0.35, 0.10],
-            k=1)[0]
+        return self.socioeconomic_sampler.sample()
     
     def generate_patient(self):
-        gender = random.choice(['M', 'F'])
+        gender = self.gender_sampler.sample()
         age = self.generate_age()
         height = self.generate_height(age, gender)
         weight = self.generate_weight(age, gender, height)
@@ -139,7 +158,9 @@ class BogotaMedicalGenerator:
         symptoms, diagnosis, chronic = self.generate_symptoms_diagnosis(age, bmi)
         blood_pressure = self.generate_blood_pressure(age, bmi)
         
-        hospital = random.choice(list(HOSPITALS_BOGOTA.keys()))
+        socioeconomic_level = self.generate_socioeconomic_level()
+        insurance = self.generate_health_insurance()
+        facility = self.facilities.sample_index(socioeconomic_level, insurance)
         
         return {
             'ID_Paciente': fake.uuid4()[:8],
@@ -154,9 +175,9 @@ class BogotaMedicalGenerator:
             'Diagnóstico (CIE-10)': f"{diagnosis[0]} - {diagnosis[1]}",
             'Enfermedades Crónicas': ', '.join(chronic) if chronic else 'Ninguna',
             'Fecha Consulta': fake.date_between(start_date='-2y').strftime("%d/%m/%Y"),
-            'Hospital': hospital,
-            'Dirección Hospital': HOSPITALS_BOGOTA[hospital]['address'],
-            'Localidad': HOSPITALS_BOGOTA[hospital]['district'],
-            'Nivel Socioeconómico': self.generate_socioeconomic_level(),
-            'Seguro Médico': self.generate_health_insurance()
+            'Hospital': self.facilities.names[facility],
+            'Dirección Hospital': self.facilities.addresses[facility],
+            'Localidad': self.facilities.districts[facility],
+            'Nivel Socioeconómico': socioeconomic_level,
+            'Seguro Médico': insurance
         }
\ No newline at end of file
@@ -0,0 +1,155 @@
+import hashlib
+import math
+import random
+import time
+from statistics import NormalDist
+import numpy as np
+import pandas as pd
+from algorithms.batch_generator import COLUMNS
+from algorithms.batch_iterator import generate_parallel
+from algorithms.data_generator import BogotaMedicalGenerator, fake
+
+NUMERIC_COLUMNS = ['Edad', 'Peso (kg)', 'Altura (cm)', 'IMC', 'Sistólica', 'Diastólica', 'Días Consulta']
+CATEGORICAL_COLUMNS = [
+    'Género', 'Síntomas', 'Diagnóstico (CIE-10)', 'Enfermedades Crónicas', 'Hospital',
+    'Dirección Hospital', 'Localidad', 'Nivel Socioeconómico', 'Seguro Médico'
+]
+
+
+def scalar_engine(rows, seed):
+    random.seed(seed)
+    np.random.seed(seed)
+    fake.seed_instance(seed)
+    generator = BogotaMedicalGenerator()
+    frame = pd.DataFrame([generator.generate_patient() for _ in range(rows)], columns=COLUMNS)
+    frame['Fecha Consulta'] = pd.to_datetime(frame['Fecha Consulta'], dayfirst=True)
+    return frame
+
+
+def batch_engine(rows, seed, workers=1, chunk_size=32768):
+    columns = generate_parallel(rows, seed, workers=workers, chunk_size=chunk_size)
+    frame = pd.DataFrame(columns, columns=COLUMNS)
+    frame['Fecha Consulta'] = pd.to_datetime(frame['Fecha Consulta'])
+    return frame
+
+
+def checksum(frame):
+    hashed = pd.util.hash_pandas_object(frame[COLUMNS], index=False).to_numpy()
+    return hashlib.sha256(hashed.tobytes()).hexdigest()
+
+
+def _comparable(frame):
+    pressure = frame['Presión Arterial'].str.extract(r'(\d+)/(\d+)').astype(int)
+    return frame.assign(**{
+        'Sistólica': pressure[0],
+        'Diastólica': pressure[1],
+        'Días Consulta': (pd.Timestamp.today().normalize() - frame['Fecha Consulta']).dt.days,
+    })
+
+
+def ks_test(first, second):
+    first, second = np.sort(first), np.sort(second)
+    grid = np.concatenate((first, second))
+    cdf_first = np.searchsorted(first, grid, side='right') / len(first)
+    cdf_second = np.searchsorted(second, grid, side='right') / len(second)
+    statistic = float(np.max(np.abs(cdf_first - cdf_second)))
+
+    effective = len(first) * len(second) / (len(first) + len(second))
+    scale = (math.sqrt(effective) + 0.12 + 0.11 / math.sqrt(effective)) * statistic
+    p_value = 2 * sum((-1) ** (k - 1) * math.exp(-2 * k * k * scale * scale)
+                      for k in range(1, 101))
+    return statistic, min(max(p_value, 0.0), 1.0)
+
+
+def chi_square_test(first, second, min_expected=5):
+    table = pd.concat([first.value_counts(), second.value_counts()], axis=1).fillna(0)
+    totals = table.sum(axis=0).to_numpy()
+    expected_share = table.sum(axis=1) / totals.sum()
+    # Categories too rare for the chi-square approximation are pooled.
+    rare = expected_share * totals.min() < min_expected
+    if rare.any():
+        table = pd.concat([table[~rare], table[rare].sum().to_frame('otros').T])
+
+    observed = table.to_numpy()
+    shares = observed / totals
+    expected = observed.sum(axis=1, keepdims=True) * totals / totals.sum()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        statistic = float(np.nansum((observed - expected) ** 2 / expected))
+    degrees = max(len(table) - 1, 1)
+
+    # Wilson-Hilferty approximation of the chi-square survival function.
+    z = ((statistic / degrees) ** (1 / 3) - (1 - 2 / (9 * degrees))) / math.sqrt(2 / (9 * degrees))
+    p_value = 1 - NormalDist().cdf(z)
+    return statistic, p_value, float(np.abs(shares[:, 0] - shares[:, 1]).max())
+
+
+def compare_distributions(reference, candidate, alpha=0.001, tolerance=0.02):
+    """Compares every column of two frames with a two-sample test.
+
+    Numeric columns use Kolmogorov-Smirnov (effect = KS statistic);
+    categorical columns use a chi-square contingency test (effect = largest
+    difference in category shares). A column is equivalent when the test does
+    not reject at ``alpha`` or the effect stays within ``tolerance``.
+    """
+    reference, candidate = _comparable(reference), _comparable(candidate)
+    results = []
+    for column in NUMERIC_COLUMNS:
+        statistic, p_value = ks_test(reference[column].to_numpy(float),
+                                     candidate[column].to_numpy(float))
+        results.append({'columna': column, 'prueba': 'KS', 'estadístico': statistic,
+                        'p_valor': p_value, 'efecto': statistic})
+    for column in CATEGORICAL_COLUMNS:
+        statistic, p_value, effect = chi_square_test(reference[column], candidate[column])
+        results.append({'columna': column, 'prueba': 'chi2', 'estadístico': statistic,
+                        'p_valor': p_value, 'efecto': effect})
+    report = pd.DataFrame(results).set_index('columna')
+    report['equivalente'] = (report['p_valor'] >= alpha) | (report['efecto'] <= tolerance)
+    return report
+
+
+def reproducibility(rows, seed, workers=(1, 2), chunk_sizes=(4096, 32768)):
+    """Checksums the batch engine across repeated runs, worker counts and chunk sizes."""
+    checksums = {}
+    for worker_count in workers:
+        for chunk_size in chunk_sizes:
+            frame = batch_engine(rows, seed, workers=worker_count, chunk_size=chunk_size)
+            checksums[(worker_count, chunk_size)] = checksum(frame)
+    checksums['repetición'] = checksum(batch_engine(rows, seed, workers=workers[0],
+                                                    chunk_size=chunk_sizes[0]))
+    scalar_runs = {checksum(scalar_engine(min(rows, 2000), seed)) for _ in range(2)}
+    return {
+        'batch_checksums': checksums,
+        'batch_deterministic': len(set(checksums.values())) == 1,
+        'scalar_deterministic': len(scalar_runs) == 1,
+    }
+
+
+def run_harness(rows=20000, seed=42, alpha=0.001, tolerance=0.02,
+                workers=(1, 2), chunk_sizes=(4096, 32768)):
+    start = time.perf_counter()
+    reference = scalar_engine(rows, seed)
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    candidate = batch_engine(rows, seed, workers=workers[-1], chunk_size=chunk_sizes[-1])
+    batch_seconds = time.perf_counter() - start
+
+    report = compare_distributions(reference, candidate, alpha, tolerance)
+    checks = reproducibility(rows, seed, workers, chunk_sizes)
+    return {
+        'columns': report,
+        'equivalent': bool(report['equivalente'].all()),
+        'deterministic': checks['batch_deterministic'] and checks['scalar_deterministic'],
+        'checksums': checks['batch_checksums'],
+        'scalar_seconds': scalar_seconds,
+        'batch_seconds': batch_seconds,
+        'speedup': scalar_seconds / batch_seconds,
+    }
+
+
+if __name__ == '__main__':
+    result = run_harness()
+    print(result['columns'].to_markdown(floatfmt='.4f'))
+    print(f"Equivalente: {result['equivalent']}  Determinista: {result['deterministic']}")
+    print(f"Escalar: {result['scalar_seconds']:.2f}s  Batch: {result['batch_seconds']:.2f}s  "
+          f"Aceleración: {result['speedup']:.1f}x")
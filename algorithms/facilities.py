@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+from algorithms.data import HOSPITALS_BOGOTA, HEALTH_INSURANCE, SOCIOECONOMIC_LEVELS
+from algorithms.sampler import AliasSampler
+
+LEVEL_PREFIX = 'nivel_'
+INSURANCE_PREFIX = 'seguro_'
+
+
+class FacilityCatalog:
+    """Weighted catalog of health facilities stored as parallel arrays.
+
+    Draws go through alias tables built once per condition, so picking a
+    facility costs O(1) whatever the catalog size. Optional affinity
+    multipliers per socioeconomic level and per insurance make the draw
+    depend on the patient; values without an affinity column weigh 1.0.
+
+    Level and insurance are drawn independently of each other, so every
+    (level, insurance) pair must be served by some facility; catalogs that
+    leave a pair without facilities are rejected. Subsets built for cohort
+    constraints skip this check.
+    """
+
+    def __init__(self, names, addresses, districts, weights=None,
+                 level_affinity=None, insurance_affinity=None, check_coverage=True):
+        self.names = np.array(list(names), dtype=object)
+        self.addresses = np.array(list(addresses), dtype=object)
+        self.districts = np.array(list(districts), dtype=object)
+        size = len(self.names)
+        if size == 0:
+            raise ValueError('The facility catalog is empty')
+        self.weights = (np.ones(size) if weights is None
+                        else np.asarray(list(weights), dtype=float))
+        self.level_affinity = {key: np.asarray(value, dtype=float)
+                               for key, value in (level_affinity or {}).items()}
+        self.insurance_affinity = {key: np.asarray(value, dtype=float)
+                                   for key, value in (insurance_affinity or {}).items()}
+        self._check_values('weight', self.weights)
+        for key, values in self.level_affinity.items():
+            self._check_values(f'{LEVEL_PREFIX}{key}', values)
+        for key, values in self.insurance_affinity.items():
+            self._check_values(f'{INSURANCE_PREFIX}{key}', values)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self._samplers = {}
+        if check_coverage:
+            unserved = [(level, insurance)
+                        for level in SOCIOECONOMIC_LEVELS for insurance in HEALTH_INSURANCE
+                        if self.conditional_weights(level, insurance).sum() <= 0]
+            if unserved:
+                raise ValueError(f"No facility serves the (level, insurance) pairs {unserved}")
+
+    def _check_values(self, column, values):
+        if len(values) != len(self.names):
+            raise ValueError(f"Facility column {column!r} has {len(values)} values "
+                             f"for {len(self.names)} facilities")
+        invalid = ~np.isfinite(values) | (values < 0)
+        if invalid.any():
+            names = list(self.names[invalid])
+            shown = ', '.join(map(str, names[:10])) + (f' and {len(names) - 10} more' if len(names) > 10 else '')
+            raise ValueError(f"Facility column {column!r} must be finite and non-negative; "
+                             f"invalid for {shown}")
+
+    @classmethod
+    def from_dict(cls, hospitals=HOSPITALS_BOGOTA):
+        return cls(
+            hospitals.keys(),
+            [info['address'] for info in hospitals.values()],
+            [info['district'] for info in hospitals.values()],
+            [info.get('weight', 1.0) for info in hospitals.values()],
+        )
+
+    @classmethod
+    def from_csv(cls, path):
+        """Loads a catalog with ``name``, ``address``, ``district`` and ``weight``
+        columns, plus optional ``nivel_<level>``/``seguro_<insurance>`` affinities."""
+        frame = pd.read_csv(path)
+        missing = {'name', 'address', 'district'} - set(frame.columns)
+        if missing:
+            raise ValueError(f"Facility file is missing columns: {sorted(missing)}")
+        return cls(
+            frame['name'], frame['address'], frame['district'],
+            frame['weight'] if 'weight' in frame else None,
+            {column[len(LEVEL_PREFIX):]: frame[column] for column in frame
+             if column.startswith(LEVEL_PREFIX)},
+            {column[len(INSURANCE_PREFIX):]: frame[column] for column in frame
+             if column.startswith(INSURANCE_PREFIX)},
+        )
+
+    def __len__(self):
+        return len(self.names)
+
+    def subset(self, hospitals=None, districts=None):
+        mask = np.ones(len(self), dtype=bool)
+        if hospitals is not None:
+            unknown = set(hospitals) - set(self.index)
+            if unknown:
+                raise ValueError(f"Unknown hospitals: {sorted(unknown)}")
+            mask &= np.isin(self.names, list(hospitals))
+        if districts is not None:
+            unknown = set(districts) - set(self.districts)
+            if unknown:
+                raise ValueError(f"Unknown districts: {sorted(unknown)}")
+            mask &= np.isin(self.districts, list(districts))
+        if not mask.any():
+            raise ValueError('No hospital satisfies the hospital and district constraints')
+        return FacilityCatalog(
+            self.names[mask], self.addresses[mask], self.districts[mask], self.weights[mask],
+            {key: value[mask] for key, value in self.level_affinity.items()},
+            {key: value[mask] for key, value in self.insurance_affinity.items()},
+            check_coverage=False,
+        )
+
+    @property
+    def conditional(self):
+        return bool(self.level_affinity or self.insurance_affinity)
+
+    def conditional_weights(self, level=None, insurance=None):
+        weights = self.weights
+        if level in self.level_affinity:
+            weights = weights * self.level_affinity[level]
+        if insurance in self.insurance_affinity:
+            weights = weights * self.insurance_affinity[insurance]
+        return weights
+
+    def sampler(self, level=None, insurance=None):
+        key = (level if level in self.level_affinity else None,
+               insurance if insurance in self.insurance_affinity else None)
+        if key not in self._samplers:
+            weights = self.conditional_weights(*key)
+            if weights.sum() <= 0:
+                served = ' with '.join(f"{name} {value!r}" for name, value
+                                       in (('level', level), ('insurance', insurance))
+                                       if value is not None)
+                raise ValueError(f"No facility serves {served or 'any patient'}")
+            self._samplers[key] = AliasSampler(range(len(self)), weights)
+        return self._samplers[key]
+
+    def sample_index(self, level=None, insurance=None):
+        return self.sampler(level, insurance).sample_index()
+
+    def sample_indices(self, n, rng=None, levels=None, insurances=None):
+        if not self.level_affinity:
+            levels = None
+        if not self.insurance_affinity:
+            insurances = None
+        if levels is None and insurances is None:
+            return self.sampler().sample_indices(n, rng)
+
+        level_codes, level_values = (pd.factorize(levels) if levels is not None
+                                     else (np.zeros(n, dtype=np.int64), [None]))
+        insurance_codes, insurance_values = (pd.factorize(insurances) if insurances is not None
+                                             else (np.zeros(n, dtype=np.int64), [None]))
+        combined = level_codes * len(insurance_values) + insurance_codes
+        indices = np.empty(n, dtype=np.int64)
+        for code in np.unique(combined):
+            rows = np.flatnonzero(combined == code)
+            level, insurance = divmod(int(code), len(insurance_values))
+            sampler = self.sampler(level_values[level], insurance_values[insurance])
+            indices[rows] = sampler.sample_indices(len(rows), rng)
+        return indices
@@ -0,0 +1,143 @@
+import argparse
+import io
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+INDEX_SUFFIX = '.idx'
+INDEX_MAGIC = b'BMRIDX1\0'
+# Magic, row count and ID width, followed by the arrays at 8-byte boundaries.
+HEADER_SIZE = len(INDEX_MAGIC) + 16
+
+
+def index_path_for(csv_path):
+    return csv_path + INDEX_SUFFIX
+
+
+def row_starts(data, header=False):
+    """Byte offset where each CSV record of ``data`` starts.
+
+    A newline ends a record only outside quotes, i.e. after an even number of
+    quote characters, so quoted fields containing line breaks are handled.
+    """
+    raw = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(raw == ord('\n'))
+    quotes = np.flatnonzero(raw == ord('"'))
+    ends = newlines[np.searchsorted(quotes, newlines) % 2 == 0]
+    starts = np.concatenate(([0], ends[:-1] + 1)).astype(np.int64)
+    return starts[1:] if header else starts
+
+
+class RowIndexBuilder:
+    """Collects the offset, ``#Fila`` and ``ID_Paciente`` of each row as a CSV
+    is streamed, and writes the sorted lookup tables on ``write``."""
+
+    def __init__(self):
+        self.offsets = []
+        self.filas = []
+        self.ids = []
+
+    def add(self, columns, starts):
+        n = len(starts)
+        first = sum(len(part) for part in self.filas) + 1
+        filas = columns['#Fila'] if '#Fila' in columns else np.arange(first, first + n)
+        ids = pd.Series(columns['ID_Paciente']).fillna('').astype(str).to_numpy(dtype=str)
+        self.offsets.append(np.asarray(starts, dtype=np.int64))
+        self.filas.append(np.asarray(filas, dtype=np.int64))
+        self.ids.append(np.char.encode(ids, 'utf-8'))
+
+    def write(self, path, end):
+        offsets = np.concatenate(self.offsets + [np.array([end], dtype=np.int64)])
+        filas = np.concatenate(self.filas) if self.filas else np.empty(0, dtype=np.int64)
+        ids = np.concatenate(self.ids) if self.ids else np.empty(0, dtype='S1')
+        ids = ids.astype(f'S{max(ids.dtype.itemsize, 1)}')
+
+        fila_rows = np.argsort(filas, kind='stable')
+        id_rows = np.argsort(ids, kind='stable')
+        with open(path, 'wb') as handle:
+            handle.write(INDEX_MAGIC)
+            handle.write(np.array([len(filas), ids.dtype.itemsize], dtype=np.uint64).tobytes())
+            for array in (offsets, filas[fila_rows], fila_rows, id_rows, ids[id_rows]):
+                handle.write(np.ascontiguousarray(array).tobytes())
+
+
+class RowIndex:
+    """Looks rows up in a CSV through its ``.idx`` sidecar.
+
+    The sidecar holds, as memory-mapped arrays, the byte offset of every row
+    in file order, the ``#Fila`` values sorted with their row positions and
+    the ``ID_Paciente`` values sorted with their row positions. A lookup is a
+    binary search followed by a seek, so only the requested rows are read.
+    Repeated ``#Fila`` values (duplicated patients) return every copy.
+    """
+
+    def __init__(self, csv_path, index_path=None):
+        self.csv_path = csv_path
+        self.index_path = index_path or index_path_for(csv_path)
+        with open(self.index_path, 'rb') as handle:
+            header = handle.read(HEADER_SIZE)
+        if header[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise ValueError(f"{self.index_path} is not a row index")
+        rows, width = np.frombuffer(header[len(INDEX_MAGIC):], dtype=np.uint64).tolist()
+
+        layout = [('offsets', np.int64, rows + 1), ('filas', np.int64, rows),
+                  ('fila_rows', np.int64, rows), ('id_rows', np.int64, rows),
+                  ('ids', f'S{width}', rows)]
+        position = HEADER_SIZE
+        for name, dtype, count in layout:
+            array = (np.memmap(self.index_path, dtype=dtype, mode='r', offset=position, shape=(count,))
+                     if count else np.empty(0, dtype=dtype))
+            setattr(self, name, array)
+            position += np.dtype(dtype).itemsize * count
+
+        if int(self.offsets[-1]) != os.path.getsize(csv_path):
+            raise ValueError(f"{self.index_path} does not match {csv_path}; rebuild the index")
+
+    def __len__(self):
+        return len(self.filas)
+
+    def rows_for_filas(self, filas):
+        filas = np.asarray(filas, dtype=np.int64)
+        low = np.searchsorted(self.filas, filas, side='left')
+        high = np.searchsorted(self.filas, filas, side='right')
+        return np.concatenate([self.fila_rows[a:b] for a, b in zip(low, high)] + [[]]).astype(np.int64)
+
+    def rows_for_ids(self, ids):
+        keys = np.char.encode(np.asarray(ids, dtype=str), 'utf-8')
+        low = np.searchsorted(self.ids, keys, side='left')
+        high = np.searchsorted(self.ids, keys, side='right')
+        return np.concatenate([self.id_rows[a:b] for a, b in zip(low, high)] + [[]]).astype(np.int64)
+
+    def read_raw(self, rows):
+        """Returns the CSV header followed by the raw bytes of ``rows``."""
+        with open(self.csv_path, 'rb') as handle:
+            header = handle.read(int(self.offsets[0])) if len(self) else b''
+            records = []
+            for row in np.asarray(rows, dtype=np.int64).tolist():
+                handle.seek(int(self.offsets[row]))
+                records.append(handle.read(int(self.offsets[row + 1] - self.offsets[row])))
+        return header + b''.join(records)
+
+    def lookup(self, filas=(), ids=()):
+        rows = np.concatenate((self.rows_for_filas(filas), self.rows_for_ids(ids)))
+        return pd.read_csv(io.BytesIO(self.read_raw(rows)), dtype={'ID_Paciente': str})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Print rows of a generated CSV by #Fila or ID_Paciente using its .idx sidecar.')
+    parser.add_argument('csv_path')
+    parser.add_argument('--fila', type=int, nargs='+', default=[], help='#Fila values to print')
+    parser.add_argument('--id', nargs='+', default=[], help='ID_Paciente values to print')
+    parser.add_argument('--index', help='index path (defaults to <csv_path>.idx)')
+    args = parser.parse_args(argv)
+
+    index = RowIndex(args.csv_path, args.index)
+    rows = np.concatenate((index.rows_for_filas(args.fila), index.rows_for_ids(args.id)))
+    sys.stdout.buffer.write(index.read_raw(rows))
+    return 0 if len(rows) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,181 @@
+import math
+import random
+import numpy as np
+
+
+class AliasSampler:
+    """Categorical sampler backed by a Walker/Vose alias table.
+
+    The table is built once per distribution, so every draw afterwards is
+    O(1): one uniform picks a column and decides between the column's own
+    index and its alias.
+    """
+
+    def __init__(self, population, weights=None):
+        self.population = list(population)
+        size = len(self.population)
+        if size == 0:
+            raise ValueError('population must not be empty')
+
+        if weights is None:
+            weights = [1.0] * size
+        weights = np.asarray(list(weights), dtype=float)
+        if len(weights) != size:
+            raise ValueError('weights and population must have the same length')
+        if not np.all(np.isfinite(weights)) or np.any(weights < 0) or weights.sum() <= 0:
+            raise ValueError('weights must be finite, non-negative and not all zero')
+
+        self.probabilities = weights / weights.sum()
+        self.cumulative = np.cumsum(self.probabilities)
+        self.prob, self.alias = self._build_table(self.probabilities)
+        self._prob = self.prob.tolist()
+        self._alias = self.alias.tolist()
+        self._size = size
+        # Filled element by element so tuples (e.g. diagnoses) stay scalars.
+        self._values = np.empty(size, dtype=object)
+        for i, value in enumerate(self.population):
+            self._values[i] = value
+
+    @staticmethod
+    def _build_table(probabilities):
+        size = len(probabilities)
+        scaled = probabilities * size
+        prob = np.ones(size)
+        alias = np.arange(size)
+
+        small = [i for i in range(size) if scaled[i] < 1.0]
+        large = [i for i in range(size) if scaled[i] >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # Whatever is left over only differs from 1.0 by rounding error.
+        for i in small + large:
+            prob[i] = 1.0
+            alias[i] = i
+        return prob, alias
+
+    def __len__(self):
+        return self._size
+
+    def sample_index(self):
+        u = random.random() * self._size
+        column = int(u)
+        if u - column < self._prob[column]:
+            return column
+        return self._alias[column]
+
+    def sample(self):
+        return self.population[self.sample_index()]
+
+    def sample_indices(self, n, rng=None):
+        rng = np.random if rng is None else rng
+        u = rng.random(n) * self._size
+        columns = u.astype(np.int64)
+        np.minimum(columns, self._size - 1, out=columns)
+        keep = (u - columns) < self.prob[columns]
+        return np.where(keep, columns, self.alias[columns])
+
+    def quantile_indices(self, u):
+        # Inverse-CDF lookup for caller-supplied uniforms. Slower than the
+        # alias draw, but monotone in u, which keeps common random numbers
+        # aligned when the weights change between runs.
+        indices = np.searchsorted(self.cumulative, u, side='right')
+        return np.minimum(indices, self._size - 1)
+
+    def sample_many(self, n, rng=None):
+        indices = self.sample_indices(n, rng)
+        return self._values[indices]
+
+
+class BernoulliSampler:
+    """Independent Bernoulli draws over a catalog, in time proportional to the
+    expected number of positives rather than to the catalog size.
+
+    Entries are grouped into buckets whose probabilities lie in
+    ``(q / 2, q]`` with ``q`` a power of two. Geometric skips jump straight
+    to the next candidate of a Bernoulli(q) sequence over each bucket, and a
+    candidate is kept with probability ``p / q``, so every entry is drawn
+    exactly with its own probability.
+    """
+
+    MAX_BUCKET = 60
+
+    def __init__(self, probabilities):
+        probabilities = np.clip(np.asarray(list(probabilities), dtype=float), 0.0, 1.0)
+        self.size = len(probabilities)
+        self.probabilities = probabilities
+        self.certain = np.flatnonzero(probabilities >= 1.0)
+
+        uncertain = np.flatnonzero((probabilities > 0) & (probabilities < 1.0))
+        levels = np.minimum(np.floor(-np.log2(probabilities[uncertain])), self.MAX_BUCKET)
+        self.buckets = []
+        for level in np.unique(levels):
+            indices = uncertain[levels == level]
+            q = 2.0 ** -level
+            self.buckets.append((indices, probabilities[indices] / q, q))
+        self._certain = self.certain.tolist()
+        self._buckets = [
+            (indices.tolist(), accept.tolist(), math.log1p(-q) if q < 1 else None)
+            for indices, accept, q in self.buckets
+        ]
+
+    def sample(self):
+        chosen = list(self._certain)
+        for indices, accept, log_miss in self._buckets:
+            size = len(indices)
+            position = -1
+            while True:
+                if log_miss is None:
+                    position += 1
+                else:
+                    position += 1 + int(math.log(1.0 - random.random()) / log_miss)
+                if position >= size:
+                    break
+                if random.random() < accept[position]:
+                    chosen.append(indices[position])
+        chosen.sort()
+        return chosen
+
+    def sample_many(self, n, rng=None):
+        """Draws ``n`` independent rows; returns the (row, entry) pairs of the
+        positives sorted by row and entry."""
+        rng = np.random if rng is None else rng
+        rows = [np.repeat(np.arange(n), len(self.certain))]
+        entries = [np.tile(self.certain, n)]
+        for indices, accept, q in self.buckets:
+            total = n * len(indices)
+            if q >= 1:
+                positions = np.arange(total)
+            else:
+                positions = self._geometric_positions(total, q, rng)
+            local = positions % len(indices)
+            kept = rng.random(len(positions)) < accept[local]
+            rows.append(positions[kept] // len(indices))
+            entries.append(indices[local[kept]])
+        rows, entries = np.concatenate(rows), np.concatenate(entries)
+        order = np.lexsort((entries, rows))
+        return rows[order], entries[order]
+
+    @staticmethod
+    def _geometric_positions(total, q, rng):
+        # Successes of a Bernoulli(q) sequence of length ``total``, found by
+        # accumulating geometric gaps instead of drawing every trial.
+        expected = total * q
+        positions = np.empty(0, dtype=np.int64)
+        last = -1
+        while last < total:
+            batch = int(expected + 4 * math.sqrt(expected) + 16)
+            # Any gap past ``total`` ends the sequence, so clipping gaps there
+            # keeps the positions exact and the sum far from int64 overflow.
+            gaps = np.minimum(rng.geometric(q, batch), total + 1)
+            steps = last + np.cumsum(gaps)
+            positions = np.concatenate((positions, steps))
+            last = int(steps[-1])
+        return positions[positions < total]
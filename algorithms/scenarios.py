@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+from algorithms import data
+from algorithms.batch_generator import (
+    BatchMedicalGenerator, symptom_table, chronic_table, BMI_EDGES, ROUTINE_DIAGNOSIS
+)
+from algorithms.sampler import AliasSampler
+
+
+class Scenario:
+    """A named set of parameter tables to evaluate in a sweep.
+
+    Any table left as ``None`` falls back to the one in ``algorithms.data``.
+    Overridden catalogs must keep the same symptoms and chronic diseases
+    (in the same order) as the defaults, since the sweep reuses one column
+    of uniforms per catalog entry.
+    """
+
+    def __init__(self, name, symptoms_diagnoses=None, chronic_diseases=None,
+                 insurance=None, socioeconomic_levels=None):
+        self.name = name
+        self.symptoms_diagnoses = symptoms_diagnoses or data.symptoms_diagnoses
+        self.chronic_diseases = chronic_diseases or data.chronic_diseases
+        self.insurance = insurance or data.HEALTH_INSURANCE
+        self.socioeconomic_levels = socioeconomic_levels or data.SOCIOECONOMIC_LEVELS
+
+
+class ScenarioSweep:
+    """What-if sweeps over one shared base population.
+
+    The demographic stage (sex, age, height, weight, BMI) and every uniform
+    variate used by the parameter-dependent stages are drawn once. Each
+    scenario then only re-evaluates symptom and chronic thresholds and the
+    categorical picks against those same uniforms (common random numbers),
+    so differences between scenarios reflect the parameters rather than
+    sampling noise.
+    """
+
+    def __init__(self, n, seed=None):
+        self.n = n
+        self.generator = BatchMedicalGenerator(seed)
+        generator, rng = self.generator, self.generator.rng
+
+        self.is_female = rng.random(n) < 0.5
+        self.age = generator._sample_ages(n, generator.age_values[0], generator.age_values[-1])
+        height = generator._sample_heights(self.age, self.is_female)
+        _, bmi, _ = generator._sample_weights(self.age, self.is_female, height, None)
+        self.age_group = np.digitize(self.age, [18, 61])
+        self.bmi_idx = np.digitize(bmi, BMI_EDGES)
+
+        k = len(generator.symptom_names)
+        c = len(generator.chronic_names)
+        self.symptom_u = rng.random((n, k))
+        self.race_u = -np.log(rng.random((n, k)))
+        self.diagnosis_u = rng.random(n)
+        self.chronic_u = rng.random((n, c))
+        self.insurance_u = rng.random(n)
+        self.socioeconomic_u = rng.random(n)
+
+    def evaluate(self, scenario):
+        generator = self.generator
+        if list(scenario.symptoms_diagnoses) != generator.symptom_names:
+            raise ValueError(f"Scenario {scenario.name!r} changes the symptom catalog")
+        if list(scenario.chronic_diseases) != generator.chronic_names:
+            raise ValueError(f"Scenario {scenario.name!r} changes the chronic disease catalog")
+
+        symptom_p = symptom_table(scenario.symptoms_diagnoses)[:, self.age_group, self.bmi_idx].T
+        symptoms = self.symptom_u < symptom_p
+        has_symptoms = symptoms.any(axis=1)
+        with np.errstate(divide='ignore'):
+            main = np.argmin(self.race_u / symptoms, axis=1)
+
+        diagnosis_counts = {ROUTINE_DIAGNOSIS[0]: int((~has_symptoms).sum())}
+        for i, (symptom, entry) in enumerate(scenario.symptoms_diagnoses.items()):
+            rows = has_symptoms & (main == i)
+            sampler = generator.build_diagnosis_sampler(entry)
+            picked = np.bincount(sampler.quantile_indices(self.diagnosis_u[rows]),
+                                 minlength=len(sampler))
+            for (code, _), count in zip(sampler.population, picked):
+                diagnosis_counts[code] = diagnosis_counts.get(code, 0) + int(count)
+
+        min_ages = np.array([params['age_range'][0]
+                             for params in scenario.chronic_diseases.values()])
+        chronic_p = chronic_table(scenario.chronic_diseases)[:, self.bmi_idx].T
+        chronic = ((self.chronic_u < chronic_p)
+                   & (self.age[:, None] >= min_ages)
+                   & has_symptoms[:, None])
+
+        insurance = AliasSampler(scenario.insurance.keys(), scenario.insurance.values())
+        levels = AliasSampler(scenario.socioeconomic_levels.keys(),
+                              scenario.socioeconomic_levels.values())
+        insurance_share = np.bincount(insurance.quantile_indices(self.insurance_u),
+                                      minlength=len(insurance)) / self.n
+        level_share = np.bincount(levels.quantile_indices(self.socioeconomic_u),
+                                  minlength=len(levels)) / self.n
+
+        aggregates = {
+            'Pacientes': self.n,
+            'Chequeo rutinario': float(np.mean(~has_symptoms)),
+            'Síntomas por paciente': float(symptoms.sum(axis=1).mean()),
+            'Con enfermedad crónica': float(chronic.any(axis=1).mean()),
+        }
+        for name, share in zip(generator.chronic_names, chronic.mean(axis=0)):
+            aggregates[f'Crónica: {name}'] = float(share)
+        for code, count in diagnosis_counts.items():
+            aggregates[f'Diagnóstico: {code}'] = count / self.n
+        for name, share in zip(insurance.population, insurance_share):
+            aggregates[f'Seguro: {name}'] = float(share)
+        for name, share in zip(levels.population, level_share):
+            aggregates[f'Nivel: {name}'] = float(share)
+        return aggregates
+
+    def run(self, scenarios):
+        return pd.DataFrame(
+            [self.evaluate(scenario) for scenario in scenarios],
+            index=pd.Index([scenario.name for scenario in scenarios], name='Escenario'),
+        )
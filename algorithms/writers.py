@@ -0,0 +1,360 @@
+import bz2
+import gzip
+import json
+import lzma
+import os
+import queue
+import shutil
+import sqlite3
+import threading
+import numpy as np
+import pandas as pd
+from algorithms.row_index import RowIndexBuilder, index_path_for, row_starts
+
+PARTITION_KEYS = ('mes', 'Hospital', 'Localidad')
+RANGE_COLUMNS = ('Edad', 'IMC', 'Fecha Consulta')
+CATEGORY_COLUMNS = (
+    'Género', 'Hospital', 'Localidad', 'Nivel Socioeconómico', 'Seguro Médico',
+    'Diagnóstico (CIE-10)'
+)
+MANIFEST_NAME = '_manifest.json'
+# Hive's directory value for rows whose partition key is missing.
+DEFAULT_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+# Characters Hive escapes in partition directory names.
+HIVE_SPECIAL = set('"#%\'*/:=?\\\x7f{[]^')
+COMPRESSED_OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+
+def _escape(value):
+    return ''.join(f'%{ord(char):02X}' if char in HIVE_SPECIAL or ord(char) < 32 else char
+                   for char in str(value))
+
+
+def _stat_value(value):
+    if isinstance(value, (np.datetime64, pd.Timestamp)):
+        return str(pd.Timestamp(value).date())
+    return value.item() if hasattr(value, 'item') else value
+
+
+class PartitionedWriter:
+    """Streams batches into a Hive-style tree of CSV files.
+
+    Rows are routed to ``root/mes=YYYY-MM[/Hospital=...][/Localidad=...]/data.csv``
+    as each batch arrives. On ``close`` a ``_manifest.json`` is written with the
+    row count, min/max of ``Edad``, ``IMC`` and ``Fecha Consulta`` and the
+    category counts of every partition, so readers can prune partitions without
+    opening their files.
+
+    A root that already holds partitions or a manifest is refused unless
+    ``overwrite=True``, which deletes them first so readers that discover
+    partitions from the directory tree never see stale files. Other files
+    in ``root`` are left alone.
+    """
+
+    def __init__(self, root, partition_by=('mes',), overwrite=False):
+        partition_by = tuple(partition_by)
+        unknown = set(partition_by) - set(PARTITION_KEYS)
+        if unknown:
+            raise ValueError(f"Cannot partition by {sorted(unknown)}; use {PARTITION_KEYS}")
+        if 'mes' not in partition_by:
+            raise ValueError("Partitions are always split by consultation month ('mes')")
+        self.root = root
+        self.partition_by = partition_by
+        self.partitions = {}
+        os.makedirs(root, exist_ok=True)
+
+        previous = [entry for entry in os.listdir(root)
+                    if entry == MANIFEST_NAME
+                    or (entry.split('=', 1)[0] in PARTITION_KEYS and '=' in entry
+                        and os.path.isdir(os.path.join(root, entry)))]
+        if previous and not overwrite:
+            raise ValueError(f"{root} already holds partitioned output; "
+                             "pass overwrite=True to replace it")
+        for entry in previous:
+            path = os.path.join(root, entry)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+
+    def write(self, columns):
+        frame = pd.DataFrame(columns)
+        keys = {'mes': pd.to_datetime(frame['Fecha Consulta']).dt.strftime('%Y-%m')}
+        keys.update({name: frame[name] for name in self.partition_by if name != 'mes'})
+        keys = [keys[name].fillna(DEFAULT_PARTITION) for name in self.partition_by]
+        for key, group in frame.groupby(keys, sort=False):
+            key = key if isinstance(key, tuple) else (key,)
+            path = os.path.join(*(f"{name}={_escape(value)}"
+                                  for name, value in zip(self.partition_by, key)))
+            self._append(path, dict(zip(self.partition_by, key)), group)
+
+    def _append(self, path, values, group):
+        stats = self.partitions.get(path)
+        file_path = os.path.join(self.root, path, 'data.csv')
+        if stats is None:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            group.to_csv(file_path, index=False)
+            stats = self.partitions[path] = {
+                'file': os.path.join(path, 'data.csv'),
+                'values': {name: _stat_value(value) for name, value in values.items()},
+                'rows': 0,
+                'min': {},
+                'max': {},
+                'counts': {column: {} for column in CATEGORY_COLUMNS},
+            }
+        else:
+            group.to_csv(file_path, index=False, header=False, mode='a')
+
+        stats['rows'] += len(group)
+        for column in RANGE_COLUMNS:
+            values = group[column].dropna()
+            if values.empty:
+                continue
+            low, high = _stat_value(values.min()), _stat_value(values.max())
+            stats['min'][column] = min(stats['min'].get(column, low), low)
+            stats['max'][column] = max(stats['max'].get(column, high), high)
+        for column in CATEGORY_COLUMNS:
+            counts = stats['counts'][column]
+            for value, count in group[column].value_counts(sort=False).items():
+                counts[value] = counts.get(value, 0) + int(count)
+
+    def close(self):
+        manifest = {
+            'partition_by': list(self.partition_by),
+            'rows': sum(stats['rows'] for stats in self.partitions.values()),
+            'partitions': [self.partitions[path] for path in sorted(self.partitions)],
+        }
+        with open(os.path.join(self.root, MANIFEST_NAME), 'w', encoding='utf-8') as handle:
+            json.dump(manifest, handle, ensure_ascii=False, indent=2)
+        return manifest
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_manifest(root):
+    with open(os.path.join(root, MANIFEST_NAME), encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def select_partitions(root, months=None, hospitals=None, districts=None,
+                      age_range=None, bmi_range=None, date_range=None):
+    """Returns the data files that may hold rows matching every filter.
+
+    Filters are checked against the manifest only: partition values for
+    ``months``/``hospitals``/``districts`` and the recorded min/max for the
+    ranges (inclusive, ISO ``YYYY-MM-DD`` strings for ``date_range``).
+    """
+    ranges = {'Edad': age_range, 'IMC': bmi_range, 'Fecha Consulta': date_range}
+    members = {
+        name: {allowed} if isinstance(allowed, str) else allowed
+        for name, allowed in (('mes', months), ('Hospital', hospitals), ('Localidad', districts))
+    }
+    selected = []
+    for partition in load_manifest(root)['partitions']:
+        keep = True
+        for name, allowed in members.items():
+            if allowed is None:
+                continue
+            if name in partition['values']:
+                keep &= partition['values'][name] in allowed
+            elif name in partition['counts']:
+                keep &= any(partition['counts'][name].get(value) for value in allowed)
+        for column, bounds in ranges.items():
+            if bounds is not None and column in partition['min']:
+                keep &= (partition['min'][column] <= bounds[1]
+                         and partition['max'][column] >= bounds[0])
+            elif bounds is not None:
+                keep = False
+        if keep:
+            selected.append(os.path.join(root, partition['file']))
+    return selected
+
+
+class CsvWriter:
+    """Streams batches into a single CSV file.
+
+    Paths ending in ``.gz``, ``.bz2`` or ``.xz`` are compressed on the fly.
+    The header is written with the first batch. With ``index=True`` (plain CSV
+    only) a ``<path>.idx`` row index is written on ``close``; see
+    ``algorithms.row_index.RowIndex``.
+    """
+
+    def __init__(self, path, index=False):
+        self.path = path
+        self.rows = 0
+        self.offset = 0
+        self.index = None
+        if index:
+            if os.path.splitext(path)[1] in COMPRESSED_OPENERS:
+                raise ValueError('Row indexes need an uncompressed CSV to seek into')
+            self.index = RowIndexBuilder()
+        self._handle = None
+
+    def write(self, columns):
+        frame = pd.DataFrame(columns)
+        header = self._handle is None
+        if header:
+            opener = COMPRESSED_OPENERS.get(os.path.splitext(self.path)[1], open)
+            self._handle = opener(self.path, 'wb')
+        data = frame.to_csv(index=False, header=header).encode('utf-8')
+        if self.index is not None:
+            self.index.add(columns, self.offset + row_starts(data, header))
+        self._handle.write(data)
+        self.offset += len(data)
+        self.rows += len(frame)
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+            if self.index is not None:
+                self.index.write(index_path_for(self.path), self.offset)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ParquetWriter:
+    """Streams batches into a Parquet file, one row group per batch."""
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = 0
+        self._writer = None
+
+    def write(self, columns):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError("Parquet output requires the 'pyarrow' package") from error
+        table = pa.Table.from_pydict({column: pa.array(values) for column, values in columns.items()})
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        else:
+            table = table.cast(self._writer.schema)
+        self._writer.write_table(table)
+        self.rows += table.num_rows
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SqliteWriter:
+    """Streams batches into a SQLite table, replacing it on the first batch.
+
+    The connection is opened by the first ``write`` so that a ``FanOutWriter``
+    worker owns it from its own thread.
+    """
+
+    def __init__(self, path, table='pacientes'):
+        self.path = path
+        self.table = table
+        self.rows = 0
+        self._connection = None
+
+    def write(self, columns):
+        frame = pd.DataFrame(columns)
+        dates = frame['Fecha Consulta']
+        if np.issubdtype(dates.dtype, np.datetime64):
+            frame['Fecha Consulta'] = dates.dt.strftime('%Y-%m-%d')
+        if_exists = 'append'
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            if_exists = 'replace'
+        frame.to_sql(self.table, self._connection, if_exists=if_exists, index=False)
+        self.rows += len(frame)
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class FanOutWriter:
+    """Dispatches every batch to several writers in a single pass.
+
+    Each writer gets its own worker thread fed by a queue holding at most
+    ``queue_size`` batches. ``write`` blocks while any queue is full, so the
+    slowest writer sets the pace and memory stays bounded to a few batches
+    per writer. Batches are shared between workers and must not be modified.
+    An error in a worker is raised by the next ``write`` or by ``close``.
+    """
+
+    _DONE = object()
+
+    def __init__(self, writers, queue_size=2):
+        if not writers:
+            raise ValueError('FanOutWriter needs at least one writer')
+        if queue_size <= 0:
+            raise ValueError('queue_size must be positive')
+        self.writers = list(writers)
+        self.errors = []
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in self.writers]
+        self._threads = [threading.Thread(target=self._work, args=(writer, batches), daemon=True)
+                         for writer, batches in zip(self.writers, self._queues)]
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self, writer, batches):
+        failed = False
+        while True:
+            columns = batches.get()
+            if columns is self._DONE:
+                break
+            if failed:
+                # Keep draining so the producer never blocks on a dead writer.
+                continue
+            try:
+                writer.write(columns)
+            except Exception as error:
+                self.errors.append(error)
+                failed = True
+        try:
+            writer.close()
+        except Exception as error:
+            self.errors.append(error)
+
+    def write(self, columns):
+        if self.errors:
+            raise self.errors[0]
+        for batches in self._queues:
+            batches.put(columns)
+
+    def close(self):
+        if self._threads:
+            for batches in self._queues:
+                batches.put(self._DONE)
+            for thread in self._threads:
+                thread.join()
+            self._threads = []
+        if self.errors:
+            raise self.errors[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,19 +1,44 @@
 from algorithms import constants
-from algorithms.data_generator import BogotaMedicalGenerator
+from algorithms.batch_iterator import PatientBatchIterator
+from algorithms.writers import PartitionedWriter, CsvWriter, FanOutWriter
 import pandas as pd
 from data_visualization import generate_graphics
 
-def create_file_data():
-    generator = BogotaMedicalGenerator()
-    data = [generator.generate_patient() for _ in range(constants.ROW_NUMBER)]
-    df = pd.DataFrame(data)
+def create_file_data(writers=None, rows=constants.ROW_NUMBER, batch_size=constants.BATCH_SIZE,
+                     seed=None, queue_size=2, corruptor=None, facilities=None,
+                     symptoms_diagnoses=None, chronic_diseases=None):
+    """Generates the dataset once and streams every batch to all ``writers``.
 
-    df['Fecha Consulta'] = pd.to_datetime(df['Fecha Consulta'], dayfirst=True)
-    df = df.sort_values('Fecha Consulta')
+    Defaults to a single CSV at ``bogota_medical_records.csv`` with its
+    ``.idx`` row index for ``python3 -m algorithms.row_index``; pass e.g.
+    ``[CsvWriter('records.csv'), CsvWriter('records.csv.gz'),
+    ParquetWriter('records.parquet'), SqliteWriter('records.db')]`` to get
+    every format from the same pass.
+    """
+    writers = writers or [CsvWriter('bogota_medical_records.csv', index=True)]
+    preview = None
+    with PatientBatchIterator(batch_size, num_rows=rows, seed=seed, corruptor=corruptor,
+                              facilities=facilities, symptoms_diagnoses=symptoms_diagnoses,
+                              chronic_diseases=chronic_diseases) as batches, \
+            FanOutWriter(writers, queue_size) as writer:
+        for batch in batches:
+            if preview is None:
+                preview = pd.DataFrame(batch).head(3)
+            writer.write(batch)
 
-    df.insert(0, '#Fila', range(1, len(df) + 1))
-    df.to_csv('bogota_medical_records.csv', index=False)
+    if preview is not None:
+        print(preview.to_markdown(index=False, numalign="left", stralign="left"))
+
+def create_partitioned_data(root='bogota_medical_records', partition_by=('mes',),
+                            rows=constants.ROW_NUMBER, batch_size=constants.BATCH_SIZE,
+                            seed=None, corruptor=None, facilities=None, overwrite=False,
+                            symptoms_diagnoses=None, chronic_diseases=None):
+    with PatientBatchIterator(batch_size, num_rows=rows, seed=seed, corruptor=corruptor,
+                              facilities=facilities, symptoms_diagnoses=symptoms_diagnoses,
+                              chronic_diseases=chronic_diseases) as batches, \
+            PartitionedWriter(root, partition_by, overwrite) as writer:
+        for batch in batches:
+            writer.write(batch)
 
-    print(df.head(3).to_markdown(index=False, numalign="left", stralign="left"))
 if __name__ == "__main__":
     generate_graphics()
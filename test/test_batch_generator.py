@@ -0,0 +1,140 @@
+import unittest
+from datetime import date
+import numpy as np
+import pandas as pd
+from algorithms.batch_generator import BatchMedicalGenerator, CohortSpec, COLUMNS
+from algorithms.data import HOSPITALS_BOGOTA
+
+class TestBatchMedicalGenerator(unittest.TestCase):
+    def setUp(self):
+        self.generator = BatchMedicalGenerator(seed=42)
+
+    def test_batch_columns_and_ranges(self):
+        batch = self.generator.generate_batch(5000)
+        self.assertEqual(list(batch), COLUMNS)
+        self.assertTrue(all(len(values) == 5000 for values in batch.values()))
+        self.assertTrue(np.all((batch['Edad'] >= 15) & (batch['Edad'] <= 100)))
+        self.assertAlmostEqual(batch['Edad'].mean(), 35, delta=1)
+        self.assertAlmostEqual(np.mean(batch['Género'] == 'F'), 0.5, delta=0.03)
+        self.assertAlmostEqual(np.mean(batch['Seguro Médico'] == 'SISBÉN'), 0.42, delta=0.03)
+        for hospital, district in zip(batch['Hospital'][:50], batch['Localidad'][:50]):
+            self.assertEqual(HOSPITALS_BOGOTA[hospital]['district'], district)
+
+        routine = batch['Síntomas'] == 'Chequeo rutinario'
+        self.assertTrue(np.all(batch['Diagnóstico (CIE-10)'][routine] == 'Z00.0 - Examen médico general'))
+        self.assertTrue(np.all(batch['Enfermedades Crónicas'][routine] == 'Ninguna'))
+
+    def test_consultation_window_matches_faker(self):
+        days = (np.datetime64(date.today(), 'D')
+                - self.generator.generate_batch(20000)['Fecha Consulta']).astype(np.int64)
+        self.assertEqual(days.min(), 1)
+        self.assertEqual(days.max(), 731)
+
+    def test_seed_reproducibility(self):
+        first = BatchMedicalGenerator(seed=7).generate_batch(200)
+        second = BatchMedicalGenerator(seed=7).generate_batch(200)
+        for column in COLUMNS:
+            np.testing.assert_array_equal(first[column], second[column])
+
+    def test_cohort_constraints(self):
+        cohort = self.generator.generate_cohort(
+            2000, age_range=(60, 100), bmi_categories='Obese', sex='M',
+            insurance=['SISBÉN', 'Sanitas'], districts='Suba')
+        self.assertEqual(len(cohort), 2000)
+        self.assertTrue((cohort['Edad'] >= 60).all())
+        bmi = cohort['Peso (kg)'] / (cohort['Altura (cm)'] / 100) ** 2
+        self.assertTrue((cohort['IMC'] >= 29.95).all())
+        self.assertGreater(bmi.min(), 28)
+        self.assertTrue((cohort['Género'] == 'M').all())
+        self.assertTrue(cohort['Seguro Médico'].isin(['SISBÉN', 'Sanitas']).all())
+        self.assertTrue((cohort['Hospital'] == 'Hospital Militar Central').all())
+
+    def test_cohort_clinical_constraints(self):
+        cohort = self.generator.generate_cohort(
+            1000, chronic_conditions=['Diabetes tipo 2', 'Hipertensión'], diagnoses=['E11', 'R53'])
+        self.assertTrue((cohort['Edad'] >= 40).all())
+        self.assertTrue(cohort['Enfermedades Crónicas'].str.contains('Diabetes tipo 2').all())
+        self.assertTrue(cohort['Enfermedades Crónicas'].str.contains('Hipertensión').all())
+        self.assertTrue(cohort['Diagnóstico (CIE-10)'].str.match(r'(E11|R53) - ').all())
+        self.assertTrue(cohort['Síntomas'].str.contains('Fatiga').all())
+
+    def test_conditional_matches_filtering(self):
+        base = self.generator.generate_cohort(200000)
+        filtered = base[base['Diagnóstico (CIE-10)'].str.startswith('E11 ')]
+        cohort = self.generator.generate_cohort(len(filtered), diagnoses='E11')
+        self.assertAlmostEqual(cohort['Edad'].mean(), filtered['Edad'].mean(), delta=1.0)
+        self.assertAlmostEqual((cohort['Síntomas'] == 'Fatiga').mean(),
+                               (filtered['Síntomas'] == 'Fatiga').mean(), delta=0.03)
+
+    def test_invalid_constraints(self):
+        with self.assertRaises(ValueError):
+            CohortSpec(insurance='Desconocido')
+        with self.assertRaises(ValueError):
+            CohortSpec(age_range=(15, 30), chronic_conditions='Enfermedad coronaria')
+        with self.assertRaises(ValueError):
+            CohortSpec(diagnoses='Z00.0', chronic_conditions='EPOC')
+        with self.assertRaises(ValueError):
+            self.generator.generate_cohort(10, hospitals='Clínica Bogotá', districts='Suba')
+        for name in ('sex', 'bmi_categories', 'insurance', 'socioeconomic_levels',
+                     'hospitals', 'districts', 'diagnoses'):
+            with self.assertRaises(ValueError):
+                CohortSpec(**{name: []})
+
+    def test_empty_cohort(self):
+        cohort = self.generator.generate_cohort(0, sex='F')
+        self.assertEqual(cohort.shape, (0, len(COLUMNS)))
+
+
+
+class TestLargeCatalog(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.symptom_p = np.concatenate(([0.3, 0.1], rng.random(2998) * 0.001))
+        self.chronic_p = np.concatenate(([0.2], rng.random(499) * 0.002))
+        symptoms = {
+            f'Síntoma {i}': {
+                'age_probability': {group: p for group in ('<18', '18-60', '>60')},
+                'diagnoses': [(f'X{i:04d}', f'Diagnóstico {i}')],
+            }
+            for i, p in enumerate(self.symptom_p)
+        }
+        chronic = {
+            f'Crónica {i}': {'base_probability': p, 'bmi_multipliers': {}, 'age_range': (15, 100)}
+            for i, p in enumerate(self.chronic_p)
+        }
+        self.catalogs = {'symptoms_diagnoses': symptoms, 'chronic_diseases': chronic}
+
+    def test_batch_marginals(self):
+        n = 40000
+        batch = BatchMedicalGenerator(seed=8, **self.catalogs).generate_batch(n)
+        symptoms = pd.Series(batch['Síntomas'])
+        routine = symptoms == 'Chequeo rutinario'
+        self.assertAlmostEqual(routine.mean(), np.prod(1 - self.symptom_p), delta=0.01)
+
+        present = symptoms[~routine].str.split(', ').explode().value_counts() / n
+        for i in (0, 1):
+            self.assertAlmostEqual(present[f'Síntoma {i}'], self.symptom_p[i], delta=0.01)
+        self.assertAlmostEqual(present.sum(), self.symptom_p.sum(), delta=0.02)
+
+        chronic = pd.Series(batch['Enfermedades Crónicas'])
+        conditions = chronic[chronic != 'Ninguna'].str.split(', ').explode().value_counts() / n
+        with_symptoms = 1 - np.prod(1 - self.symptom_p)
+        self.assertAlmostEqual(conditions['Crónica 0'], self.chronic_p[0] * with_symptoms, delta=0.01)
+        self.assertAlmostEqual(conditions.sum(), self.chronic_p.sum() * with_symptoms, delta=0.02)
+
+    def test_scalar_engine_and_cohorts_use_catalog(self):
+        generator = BatchMedicalGenerator(seed=9, **self.catalogs)
+        patients = pd.DataFrame([generator.generate_patient() for _ in range(3000)])
+        symptoms = patients['Síntomas'][patients['Síntomas'] != 'Chequeo rutinario']
+        self.assertAlmostEqual(symptoms.str.split(', ').str.len().sum() / 3000,
+                               self.symptom_p.sum(), delta=0.06)
+
+        cohort = generator.generate_cohort(500, diagnoses='X0001', chronic_conditions='Crónica 0')
+        self.assertTrue((cohort['Diagnóstico (CIE-10)'] == 'X0001 - Diagnóstico 1').all())
+        self.assertTrue(cohort['Enfermedades Crónicas'].str.contains('Crónica 0').all())
+        with self.assertRaises(ValueError):
+            generator.generate_batch(10, CohortSpec(diagnoses='E11'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import numpy as np
+import pandas as pd
+from algorithms.batch_generator import COLUMNS
+from algorithms.batch_iterator import PatientBatchIterator, BlockStream, generate_parallel
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+class TestPatientBatchIterator(unittest.TestCase):
+    def test_numpy_batches(self):
+        with PatientBatchIterator(100, num_batches=3, seed=42) as batches:
+            result = list(batches)
+        self.assertEqual(len(result), 3)
+        self.assertEqual(list(result[0]), ['#Fila'] + COLUMNS)
+        rows = np.concatenate([batch['#Fila'] for batch in result])
+        np.testing.assert_array_equal(rows, np.arange(1, 301))
+
+    def test_empty_ranges(self):
+        for columns in (generate_parallel(0, seed=42), BlockStream(42).rows(10, 10)):
+            self.assertEqual(list(columns), ['#Fila'] + COLUMNS)
+            self.assertTrue(all(len(values) == 0 for values in columns.values()))
+
+    def test_prefetch_is_deterministic(self):
+        with PatientBatchIterator(50, num_batches=4, seed=7, prefetch=2) as batches:
+            prefetched = [batch['ID_Paciente'] for batch in batches]
+        with PatientBatchIterator(50, num_batches=4, seed=7, prefetch=0) as batches:
+            direct = [batch['ID_Paciente'] for batch in batches]
+        for first, second in zip(prefetched, direct):
+            np.testing.assert_array_equal(first, second)
+
+    def test_seek(self):
+        with PatientBatchIterator(50, seed=7) as batches:
+            expected = [next(batches) for _ in range(3)][2]
+            batches.seek(2)
+            sought = next(batches)
+            self.assertEqual(batches.position, 3)
+        np.testing.assert_array_equal(sought['Nombre'], expected['Nombre'])
+        self.assertEqual(sought['#Fila'][0], 101)
+
+    def test_stream_ignores_batch_size(self):
+        with PatientBatchIterator(3000, num_batches=2, seed=3, prefetch=0) as batches:
+            large = np.concatenate([batch['Nombre'] for batch in batches])
+        with PatientBatchIterator(1000, num_batches=6, seed=3, prefetch=0) as batches:
+            small = np.concatenate([batch['Nombre'] for batch in batches])
+        np.testing.assert_array_equal(large, small)
+
+    def test_pandas_output(self):
+        with PatientBatchIterator(20, num_batches=1, output='pandas', seed=1) as batches:
+            frame = next(batches)
+        self.assertIsInstance(frame, pd.DataFrame)
+        self.assertEqual(list(frame.columns), ['#Fila'] + COLUMNS)
+        self.assertEqual(len(frame), 20)
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow_output(self):
+        with PatientBatchIterator(20, num_batches=1, output='arrow', seed=1) as batches:
+            record_batch = next(batches)
+        self.assertEqual(record_batch.num_rows, 20)
+        self.assertEqual(record_batch.schema.names, ['#Fila'] + COLUMNS)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            PatientBatchIterator(0)
+        with self.assertRaises(ValueError):
+            PatientBatchIterator(10, output='csv')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from algorithms.batch_iterator import PatientBatchIterator
+from algorithms.corruption import Corruptor
+
+class TestCorruptor(unittest.TestCase):
+    def setUp(self):
+        with PatientBatchIterator(5000, num_batches=1, seed=42, prefetch=0) as batches:
+            self.clean = next(batches)
+        self.corruptor = Corruptor(
+            missing={'Edad': 0.05, 'Seguro Médico': 0.05, 'Fecha Consulta': 0.02},
+            name_typos=0.1, swapped_dates=0.1, weight_units=0.05, height_units=0.05,
+            blood_pressure=0.05, duplicates=0.02, seed=7)
+
+    def corrupt(self):
+        return self.corruptor.apply(self.clean, self.corruptor.rng_for(0))
+
+    def test_ground_truth_matches_edits(self):
+        dirty, truth = self.corrupt()
+        original_rows = len(self.clean['#Fila'])
+        duplicates = truth[truth['Error'] == 'paciente_duplicado']
+        self.assertEqual(len(dirty['#Fila']), original_rows + len(duplicates))
+
+        for column in ['Nombre', 'Fecha Consulta', 'Peso (kg)', 'Altura (cm)',
+                       'Presión Arterial', 'Edad', 'Seguro Médico']:
+            clean = pd.Series(self.clean[column])
+            changed = pd.Series(dirty[column][:original_rows])
+            differs = ~((clean == changed) | (clean.isna() & changed.isna()))
+            recorded = set(truth.loc[truth['Columna'] == column, '#Fila'])
+            self.assertEqual(set(self.clean['#Fila'][differs.to_numpy()]), recorded, column)
+            self.assertGreater(len(recorded), 0, column)
+
+    def test_invalid_configuration(self):
+        for missing in ({'Edda': 0.1}, {'#Fila': 0.1}, {'Edad': 1.5}):
+            with self.assertRaises(ValueError):
+                Corruptor(missing=missing)
+        with self.assertRaises(ValueError):
+            Corruptor(name_typos=-0.1)
+        with self.assertRaises(ValueError):
+            Corruptor(duplicates=float('nan'))
+
+    def test_error_shapes(self):
+        dirty, truth = self.corrupt()
+        rows = truth.loc[truth['Error'] == 'unidades_metros', '#Fila'].to_numpy() - 1
+        self.assertTrue((dirty['Altura (cm)'][rows] < 3).all())
+
+        rows = truth.loc[truth['Error'] == 'dia_mes_invertidos', '#Fila'].to_numpy() - 1
+        original = pd.to_datetime(self.clean['Fecha Consulta'][rows])
+        swapped = pd.to_datetime(dirty['Fecha Consulta'][rows])
+        np.testing.assert_array_equal(original.day, swapped.month)
+        np.testing.assert_array_equal(original.month, swapped.day)
+
+        rows = truth.loc[truth['Error'] == 'fuera_de_rango', '#Fila'].to_numpy() - 1
+        systolic = pd.Series(dirty['Presión Arterial'][rows]).str.split('/').str[0].astype(int)
+        self.assertTrue((systolic > 180).all())
+
+        self.assertEqual(truth.duplicated(['#Fila', 'Columna']).sum(), 0)
+
+    def test_deterministic_and_sidecar(self):
+        first, _ = self.corrupt()
+        second, _ = self.corrupt()
+        np.testing.assert_array_equal(first['Nombre'], second['Nombre'])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'ground_truth.csv')
+            corruptor = Corruptor(name_typos=0.1, seed=1, ground_truth=path)
+            with PatientBatchIterator(1000, num_rows=2500, seed=1, corruptor=corruptor) as batches:
+                sizes = [len(batch['#Fila']) for batch in batches]
+            self.assertEqual(sizes, [1000, 1000, 500])
+            truth = pd.read_csv(path)
+            self.assertTrue((truth['Columna'] == 'Nombre').all())
+            self.assertAlmostEqual(len(truth) / 2500, 0.1, delta=0.03)
+
+    def test_sidecar_is_rewritten_and_batches_recorded_once(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'ground_truth.csv')
+            for _ in range(2):
+                corruptor = Corruptor(name_typos=0.1, seed=1, ground_truth=path)
+                with PatientBatchIterator(500, num_rows=1500, seed=1, corruptor=corruptor) as batches:
+                    next(batches)
+                    batches.seek(0)
+                    list(batches)
+                truth = pd.read_csv(path)
+                self.assertEqual(truth.duplicated().sum(), 0)
+                self.assertAlmostEqual(len(truth) / 1500, 0.1, delta=0.04)
+
+
+if __name__ == '__main__':
+    unittest.main()
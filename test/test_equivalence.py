@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+import pandas as pd
+from algorithms import equivalence
+
+class TestEquivalenceHarness(unittest.TestCase):
+    def test_engines_are_equivalent(self):
+        reference = equivalence.scalar_engine(3000, seed=42)
+        candidate = equivalence.batch_engine(3000, seed=42)
+        report = equivalence.compare_distributions(reference, candidate)
+        self.assertEqual(
+            list(report.index),
+            equivalence.NUMERIC_COLUMNS + equivalence.CATEGORICAL_COLUMNS)
+        self.assertTrue(report['equivalente'].all(), report)
+
+    def test_detects_shifted_distribution(self):
+        reference = equivalence.batch_engine(3000, seed=1)
+        candidate = equivalence.batch_engine(3000, seed=2)
+        candidate['Edad'] = candidate['Edad'] + 5
+        candidate['Seguro Médico'] = 'SISBÉN'
+        report = equivalence.compare_distributions(reference, candidate)
+        self.assertFalse(report.loc['Edad', 'equivalente'])
+        self.assertFalse(report.loc['Seguro Médico', 'equivalente'])
+        self.assertTrue(report.loc['Género', 'equivalente'])
+
+    def test_statistical_tests(self):
+        rng = np.random.default_rng(0)
+        _, p_same = equivalence.ks_test(rng.normal(size=2000), rng.normal(size=2000))
+        _, p_shift = equivalence.ks_test(rng.normal(size=2000), rng.normal(0.5, size=2000))
+        self.assertGreater(p_same, 0.001)
+        self.assertLess(p_shift, 0.001)
+
+        first = pd.Series(rng.choice(['a', 'b', 'c'], 2000))
+        second = pd.Series(rng.choice(['a', 'b', 'c'], 2000, p=[0.6, 0.2, 0.2]))
+        _, p_value, effect = equivalence.chi_square_test(first, second)
+        self.assertLess(p_value, 0.001)
+        self.assertGreater(effect, 0.2)
+
+    def test_reproducibility(self):
+        checks = equivalence.reproducibility(5000, seed=7, workers=(1, 2), chunk_sizes=(1000, 4096))
+        self.assertTrue(checks['batch_deterministic'])
+        self.assertTrue(checks['scalar_deterministic'])
+        self.assertEqual(len(checks['batch_checksums']), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+import warnings
+import numpy as np
+import pandas as pd
+from algorithms.batch_generator import BatchMedicalGenerator
+from algorithms.data import HOSPITALS_BOGOTA
+from algorithms.data_generator import BogotaMedicalGenerator
+from algorithms.facilities import FacilityCatalog
+
+class TestFacilityCatalog(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'ips.csv')
+        size = 3000
+        pd.DataFrame({
+            'name': [f'IPS {i}' for i in range(size)],
+            'address': [f'Calle {i}' for i in range(size)],
+            'district': np.where(np.arange(size) % 3 == 0, 'Suba', 'Kennedy'),
+            'weight': np.where(np.arange(size) < 10, 100.0, 1.0),
+            'nivel_Alto': np.where(np.arange(size) % 3 == 0, 10.0, 0.0),
+            'seguro_Particular': np.where(np.arange(size) == 6, 1.0, 0.0),
+        }).to_csv(self.path, index=False)
+        self.catalog = FacilityCatalog.from_csv(self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_default_catalog(self):
+        catalog = FacilityCatalog.from_dict()
+        self.assertEqual(list(catalog.names), list(HOSPITALS_BOGOTA))
+        self.assertFalse(catalog.conditional)
+        counts = np.bincount(catalog.sample_indices(20000, np.random.default_rng(0)), minlength=5)
+        np.testing.assert_allclose(counts / 20000, 0.2, atol=0.015)
+
+    def test_weighted_draws(self):
+        self.assertEqual(len(self.catalog), 3000)
+        indices = self.catalog.sample_indices(50000, np.random.default_rng(1))
+        heavy_share = np.mean(indices < 10)
+        self.assertAlmostEqual(heavy_share, 1000 / (1000 + 2990), delta=0.01)
+        self.assertIn(self.catalog.sample_index(), range(3000))
+
+    def test_conditional_draws(self):
+        levels = np.array(['Alto', 'Bajo'] * 5000, dtype=object)
+        plans = np.array(['SISBÉN'] * 9998 + ['Particular'] * 2, dtype=object)
+        indices = self.catalog.sample_indices(10000, np.random.default_rng(2), levels, plans)
+        self.assertTrue((self.catalog.districts[indices[levels == 'Alto']] == 'Suba').all())
+        self.assertIn('Kennedy', set(self.catalog.districts[indices[levels == 'Bajo']]))
+        self.assertTrue((indices[-2:] == 6).all())
+
+    def test_invalid_weights(self):
+        frame = pd.read_csv(self.path)
+        frame.loc[4, 'weight'] = np.nan
+        frame.to_csv(self.path, index=False)
+        with self.assertRaisesRegex(ValueError, 'IPS 4'):
+            FacilityCatalog.from_csv(self.path)
+        with self.assertRaisesRegex(ValueError, 'nivel_Alto'):
+            FacilityCatalog(['a', 'b'], ['x', 'y'], ['Suba', 'Suba'],
+                            level_affinity={'Alto': [1.0, -1.0]})
+
+    def test_unserved_pairs_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, "'Particular'"):
+            FacilityCatalog(['a', 'b'], ['x', 'y'], ['Suba', 'Suba'],
+                            insurance_affinity={'Particular': [0.0, 0.0]})
+
+    def test_conditional_catalog_generates_every_row(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            batch = BatchMedicalGenerator(seed=3, facilities=self.catalog).generate_batch(5000)
+        self.assertEqual(len(batch['Hospital']), 5000)
+        particular = batch['Seguro Médico'] == 'Particular'
+        self.assertTrue(particular.any())
+        self.assertTrue((batch['Hospital'][particular] == 'IPS 6').all())
+
+        generator = BogotaMedicalGenerator(facilities=self.catalog)
+        patients = [generator.generate_patient() for _ in range(300)]
+        self.assertTrue(all(patient['Hospital'] in self.catalog.index for patient in patients))
+
+    def test_subset(self):
+        suba = self.catalog.subset(districts=['Suba'])
+        self.assertEqual(len(suba), 1000)
+        with self.assertRaises(ValueError):
+            self.catalog.subset(hospitals=['IPS 1'], districts=['Suba'])
+        with self.assertRaises(ValueError):
+            self.catalog.subset(districts=['Usme'])
+        with self.assertRaises(ValueError):
+            suba.subset(hospitals=['IPS 3']).sampler('Medio', 'Particular')
+
+    def test_generators_use_catalog(self):
+        patient = BogotaMedicalGenerator(self.catalog).generate_patient()
+        self.assertIn(patient['Hospital'], self.catalog.index)
+
+        generator = BatchMedicalGenerator(seed=3, facilities=self.catalog)
+        batch = generator.generate_batch(4000)
+        high = batch['Nivel Socioeconómico'] == 'Alto'
+        self.assertTrue((batch['Localidad'][high] == 'Suba').all())
+
+        cohort = generator.generate_cohort(2000, districts='Kennedy')
+        self.assertTrue((cohort['Localidad'] == 'Kennedy').all())
+        self.assertFalse((cohort['Nivel Socioeconómico'] == 'Alto').any())
+
+
+if __name__ == '__main__':
+    unittest.main()
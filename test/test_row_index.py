@@ -0,0 +1,78 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from algorithms.batch_iterator import PatientBatchIterator
+from algorithms.corruption import Corruptor
+from algorithms.row_index import RowIndex, index_path_for, main, row_starts
+from algorithms.writers import CsvWriter
+
+class TestRowStarts(unittest.TestCase):
+    def test_quoted_line_breaks(self):
+        data = b'a,b\n1,"x\ny"\n2,z\n'
+        np.testing.assert_array_equal(row_starts(data), [0, 4, 12])
+        np.testing.assert_array_equal(row_starts(data, header=True), [4, 12])
+
+
+class TestRowIndex(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'records.csv')
+        corruptor = Corruptor(missing={'ID_Paciente': 0.01}, duplicates=0.01, seed=7)
+        with PatientBatchIterator(700, num_rows=3000, seed=42, corruptor=corruptor) as batches, \
+                CsvWriter(self.path, index=True) as writer:
+            for batch in batches:
+                writer.write(batch)
+        self.frame = pd.read_csv(self.path, dtype={'ID_Paciente': str})
+        self.index = RowIndex(self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_offsets_point_at_every_row(self):
+        self.assertEqual(len(self.index), len(self.frame))
+        rows = np.arange(0, len(self.frame), 37)
+        found = pd.read_csv(io.BytesIO(self.index.read_raw(rows)), dtype={'ID_Paciente': str})
+        pd.testing.assert_frame_equal(found, self.frame.iloc[rows].reset_index(drop=True))
+
+    def test_lookup_by_fila(self):
+        found = self.index.lookup(filas=[1, 1500, 3000])
+        self.assertEqual(found['#Fila'].tolist(), [1, 1500, 3000])
+        pd.testing.assert_frame_equal(
+            found, self.frame[self.frame['#Fila'].isin([1, 1500, 3000])].reset_index(drop=True))
+
+    def test_duplicated_patients_return_every_copy(self):
+        duplicated = self.frame['#Fila'][self.frame['#Fila'].duplicated()].iloc[0]
+        self.assertEqual(len(self.index.lookup(filas=[duplicated])), 2)
+
+    def test_lookup_by_id(self):
+        ids = self.frame['ID_Paciente'].dropna().iloc[[3, 400, 2500]].tolist()
+        found = self.index.lookup(ids=ids)
+        self.assertEqual(sorted(found['ID_Paciente']), sorted(ids))
+        self.assertTrue(self.index.lookup(ids=['no-existe']).empty)
+
+    def test_stale_index(self):
+        with open(self.path, 'ab') as handle:
+            handle.write(b'\n')
+        with self.assertRaises(ValueError):
+            RowIndex(self.path)
+
+    def test_compressed_csv_cannot_be_indexed(self):
+        with self.assertRaises(ValueError):
+            CsvWriter(self.path + '.gz', index=True)
+
+    def test_command_line(self):
+        output = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+        with contextlib.redirect_stdout(output):
+            status = main([self.path, '--fila', '10', '--index', index_path_for(self.path)])
+        output.seek(0)
+        printed = pd.read_csv(output, dtype={'ID_Paciente': str})
+        self.assertEqual(status, 0)
+        self.assertEqual(printed['#Fila'].tolist(), [10])
+
+
+if __name__ == '__main__':
+    unittest.main()
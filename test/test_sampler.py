@@ -0,0 +1,118 @@
+import unittest
+import random
+import numpy as np
+from algorithms.sampler import AliasSampler, BernoulliSampler
+
+class TestAliasSampler(unittest.TestCase):
+    def setUp(self):
+        random.seed(42)
+        np.random.seed(42)
+        self.population = ['Bajo', 'Medio', 'Alto']
+        self.weights = [0.55, 0.35, 0.10]
+        self.sampler = AliasSampler(self.population, self.weights)
+
+    def test_table_preserves_probabilities(self):
+        size = len(self.sampler)
+        recovered = self.sampler.prob / size
+        for i in range(size):
+            recovered[self.sampler.alias[i]] += (1 - self.sampler.prob[i]) / size
+        np.testing.assert_allclose(recovered, self.weights)
+
+    def test_scalar_distribution(self):
+        draws = [self.sampler.sample() for _ in range(20000)]
+        for level, weight in zip(self.population, self.weights):
+            self.assertAlmostEqual(draws.count(level) / len(draws), weight, delta=0.02)
+
+    def test_bulk_distribution(self):
+        indices = self.sampler.sample_indices(50000, np.random.default_rng(7))
+        frequencies = np.bincount(indices, minlength=3) / len(indices)
+        np.testing.assert_allclose(frequencies, self.weights, atol=0.01)
+
+        values = self.sampler.sample_many(10)
+        self.assertEqual(len(values), 10)
+        self.assertTrue(set(values) <= set(self.population))
+
+    def test_tuple_population(self):
+        diagnoses = [('A90', 'Dengue'), ('R51', 'Cefalea')]
+        values = AliasSampler(diagnoses).sample_many(5)
+        self.assertEqual(values.shape, (5,))
+        self.assertIn(values[0], diagnoses)
+
+    def test_uniform_and_zero_weights(self):
+        uniform = AliasSampler(['M', 'F'])
+        np.testing.assert_allclose(uniform.probabilities, [0.5, 0.5])
+
+        never_last = AliasSampler(['a', 'b', 'c'], [1, 1, 0])
+        self.assertNotIn(2, set(never_last.sample_indices(5000)))
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            AliasSampler([])
+        with self.assertRaises(ValueError):
+            AliasSampler(['a', 'b'], [1])
+        with self.assertRaises(ValueError):
+            AliasSampler(['a', 'b'], [0, 0])
+        with self.assertRaises(ValueError):
+            AliasSampler(['a', 'b', 'c'], [float('nan'), 3, 1])
+        with self.assertRaises(ValueError):
+            AliasSampler(['a', 'b'], [float('inf'), 1])
+
+
+class TestBernoulliSampler(unittest.TestCase):
+    def setUp(self):
+        random.seed(42)
+        self.probabilities = np.array([1.0, 0.0, 0.7, 0.3, 0.05, 0.004, 0.0009])
+        self.sampler = BernoulliSampler(self.probabilities)
+
+    def test_buckets_cover_uncertain_entries(self):
+        np.testing.assert_array_equal(self.sampler.certain, [0])
+        indices = np.concatenate([indices for indices, _, _ in self.sampler.buckets])
+        self.assertEqual(sorted(indices), [2, 3, 4, 5, 6])
+        for indices, accept, q in self.sampler.buckets:
+            self.assertTrue(np.all((accept > 0.5) & (accept <= 1.0)))
+            np.testing.assert_allclose(accept * q, self.probabilities[indices])
+
+    def test_scalar_marginals(self):
+        counts = np.zeros(len(self.probabilities))
+        for _ in range(40000):
+            chosen = self.sampler.sample()
+            self.assertEqual(chosen, sorted(set(chosen)))
+            counts[chosen] += 1
+        np.testing.assert_allclose(counts / 40000, self.probabilities, atol=0.01)
+
+    def test_bulk_marginals_and_order(self):
+        rows, entries = self.sampler.sample_many(200000, np.random.default_rng(3))
+        self.assertTrue(np.all(np.diff(rows * len(self.probabilities) + entries) > 0))
+        frequencies = np.bincount(entries, minlength=len(self.probabilities)) / 200000
+        tolerance = 4 * np.sqrt(self.probabilities * (1 - self.probabilities) / 200000)
+        self.assertTrue(np.all(np.abs(frequencies - self.probabilities) <= tolerance + 1e-12))
+
+    def test_entries_are_independent(self):
+        rows, entries = self.sampler.sample_many(100000, np.random.default_rng(5))
+        both = np.intersect1d(rows[entries == 2], rows[entries == 3])
+        self.assertAlmostEqual(len(both) / 100000, 0.7 * 0.3, delta=0.01)
+
+    def test_default_rng_follows_numpy_seed(self):
+        draws = []
+        for _ in range(2):
+            np.random.seed(9)
+            draws.append(self.sampler.sample_many(500))
+        for first, second in zip(*draws):
+            np.testing.assert_array_equal(first, second)
+
+    def test_tiny_probabilities(self):
+        sampler = BernoulliSampler([1e-19, 0.2, 1e-300])
+        rows, entries = sampler.sample_many(1000, np.random.default_rng(11))
+        self.assertTrue(np.all((rows >= 0) & (rows < 1000)))
+        self.assertEqual(set(entries.tolist()), {1})
+
+    def test_empty_catalog(self):
+        sampler = BernoulliSampler([])
+        self.assertEqual(sampler.sample(), [])
+        rows, entries = sampler.sample_many(10)
+        self.assertEqual(len(rows), 0)
+        self.assertEqual(len(entries), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import copy
+import unittest
+import numpy as np
+from algorithms import data
+from algorithms.scenarios import Scenario, ScenarioSweep
+
+class TestScenarioSweep(unittest.TestCase):
+    def setUp(self):
+        self.sweep = ScenarioSweep(50000, seed=42)
+
+    def test_baseline_matches_catalog(self):
+        result = self.sweep.run([Scenario('base')])
+        self.assertEqual(result.loc['base', 'Pacientes'], 50000)
+        self.assertAlmostEqual(result.loc['base', 'Seguro: SISBÉN'], 0.42, delta=0.01)
+        self.assertAlmostEqual(result.loc['base', 'Nivel: Bajo'], 0.55, delta=0.01)
+        diagnosis_share = result.filter(like='Diagnóstico: ').loc['base'].sum()
+        self.assertAlmostEqual(diagnosis_share, 1.0)
+
+    def test_common_random_numbers(self):
+        chronic = copy.deepcopy(data.chronic_diseases)
+        multipliers = chronic['Diabetes tipo 2']['bmi_multipliers']
+        for category in multipliers:
+            multipliers[category] *= 1.5
+        insurance = dict(data.HEALTH_INSURANCE, **{'SISBÉN': 0.50})
+
+        result = self.sweep.run([
+            Scenario('base'),
+            Scenario('diabetes', chronic_diseases=chronic),
+            Scenario('sisben', insurance=insurance),
+        ])
+        base, diabetes, sisben = result.loc['base'], result.loc['diabetes'], result.loc['sisben']
+
+        self.assertGreater(diabetes['Crónica: Diabetes tipo 2'], base['Crónica: Diabetes tipo 2'])
+        self.assertEqual(diabetes['Crónica: Hipertensión'], base['Crónica: Hipertensión'])
+        self.assertEqual(diabetes['Seguro: SISBÉN'], base['Seguro: SISBÉN'])
+        self.assertGreater(sisben['Seguro: SISBÉN'], base['Seguro: SISBÉN'])
+        np.testing.assert_array_equal(sisben.filter(like='Crónica: '), base.filter(like='Crónica: '))
+
+    def test_catalog_change_rejected(self):
+        chronic = dict(data.chronic_diseases)
+        chronic.pop('EPOC')
+        with self.assertRaises(ValueError):
+            self.sweep.evaluate(Scenario('sin EPOC', chronic_diseases=chronic))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+import pandas as pd
+from algorithms.batch_iterator import PatientBatchIterator
+from algorithms.writers import (
+    PartitionedWriter, CsvWriter, ParquetWriter, SqliteWriter, FanOutWriter,
+    load_manifest, select_partitions
+)
+
+class TestPartitionedWriter(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        with PatientBatchIterator(500, num_batches=3, seed=42) as batches:
+            self.batches = list(batches)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, partition_by, overwrite=False):
+        with PartitionedWriter(self.root, partition_by, overwrite) as writer:
+            for batch in self.batches:
+                writer.write(batch)
+        return load_manifest(self.root)
+
+    def test_month_partitions(self):
+        manifest = self.write(('mes',))
+        self.assertEqual(manifest['rows'], 1500)
+        for partition in manifest['partitions']:
+            month = partition['values']['mes']
+            frame = pd.read_csv(os.path.join(self.root, partition['file']))
+            self.assertEqual(len(frame), partition['rows'])
+            self.assertTrue(frame['Fecha Consulta'].str.startswith(month).all())
+            self.assertEqual(frame['Edad'].min(), partition['min']['Edad'])
+            self.assertEqual(frame['Fecha Consulta'].max(), partition['max']['Fecha Consulta'])
+            self.assertEqual(sum(partition['counts']['Género'].values()), len(frame))
+
+    def test_hive_layout_and_pruning(self):
+        manifest = self.write(('mes', 'Localidad'))
+        first = manifest['partitions'][0]
+        self.assertTrue(first['file'].startswith(f"mes={first['values']['mes']}"))
+        self.assertIn('Localidad=', first['file'])
+
+        suba = select_partitions(self.root, districts='Suba')
+        self.assertTrue(suba)
+        self.assertTrue(all('Localidad=Suba' in path for path in suba))
+
+        month = select_partitions(self.root, months=[first['values']['mes']])
+        self.assertTrue(all(f"mes={first['values']['mes']}" in path for path in month))
+        self.assertEqual(select_partitions(self.root, age_range=(101, 120)), [])
+
+    def test_rewrite_replaces_previous_partitions(self):
+        self.write(('mes',))
+        notes = os.path.join(self.root, 'notas.txt')
+        with open(notes, 'w') as handle:
+            handle.write('no borrar')
+        with self.assertRaises(ValueError):
+            PartitionedWriter(self.root)
+
+        manifest = self.write(('mes', 'Localidad'), overwrite=True)
+        on_disk = sorted(
+            os.path.relpath(os.path.join(directory, name), self.root)
+            for directory, _, names in os.walk(self.root) for name in names
+            if name == 'data.csv')
+        self.assertEqual(on_disk, sorted(os.path.normpath(p['file']) for p in manifest['partitions']))
+        self.assertEqual(manifest['rows'], 1500)
+        self.assertTrue(os.path.exists(notes))
+
+    def test_invalid_partition_key(self):
+        with self.assertRaises(ValueError):
+            PartitionedWriter(self.root, ('Seguro Médico',))
+
+
+class FailingWriter:
+    def write(self, columns):
+        raise OSError('disk full')
+
+    def close(self):
+        pass
+
+
+class GatedWriter:
+    def __init__(self):
+        self.gate = threading.Event()
+        self.written = 0
+
+    def write(self, columns):
+        self.gate.wait()
+        self.written += 1
+
+    def close(self):
+        pass
+
+
+class TestFanOutWriter(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        with PatientBatchIterator(500, num_batches=3, seed=42) as batches:
+            self.batches = list(batches)
+        self.expected = pd.concat([pd.DataFrame(batch) for batch in self.batches])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    def test_every_writer_gets_every_row(self):
+        writers = [
+            CsvWriter(self.path('records.csv')),
+            CsvWriter(self.path('records.csv.gz')),
+            SqliteWriter(self.path('records.db')),
+            PartitionedWriter(self.path('partitioned')),
+        ]
+        with FanOutWriter(writers, queue_size=1) as fan_out:
+            for batch in self.batches:
+                fan_out.write(batch)
+
+        plain = pd.read_csv(self.path('records.csv'))
+        compressed = pd.read_csv(self.path('records.csv.gz'))
+        pd.testing.assert_frame_equal(plain, compressed)
+        self.assertEqual(plain['#Fila'].tolist(), self.expected['#Fila'].tolist())
+        self.assertEqual(plain['ID_Paciente'].tolist(), self.expected['ID_Paciente'].tolist())
+
+        with sqlite3.connect(self.path('records.db')) as connection:
+            table = pd.read_sql('SELECT * FROM pacientes', connection)
+        self.assertEqual(table['Síntomas'].tolist(), self.expected['Síntomas'].tolist())
+        self.assertEqual(table['Fecha Consulta'].tolist(), plain['Fecha Consulta'].tolist())
+        self.assertEqual(load_manifest(self.path('partitioned'))['rows'], len(self.expected))
+
+    def test_parquet_writer(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+        with FanOutWriter([ParquetWriter(self.path('records.parquet'))]) as fan_out:
+            for batch in self.batches:
+                fan_out.write(batch)
+        frame = pd.read_parquet(self.path('records.parquet'))
+        self.assertEqual(frame['ID_Paciente'].tolist(), self.expected['ID_Paciente'].tolist())
+        self.assertEqual(frame['Edad'].tolist(), self.expected['Edad'].tolist())
+
+    def test_queue_bounds_the_producer(self):
+        gated = GatedWriter()
+        fan_out = FanOutWriter([gated, CsvWriter(self.path('fast.csv'))], queue_size=1)
+        producer = threading.Thread(target=lambda: [fan_out.write(b) for b in self.batches])
+        producer.start()
+        producer.join(timeout=0.5)
+        # The gated writer holds one batch and its queue one more.
+        self.assertTrue(producer.is_alive())
+        gated.gate.set()
+        producer.join()
+        fan_out.close()
+        self.assertEqual(gated.written, len(self.batches))
+
+    def test_writer_errors_are_raised(self):
+        fan_out = FanOutWriter([FailingWriter(), CsvWriter(self.path('ok.csv'))])
+        with self.assertRaises(OSError):
+            with fan_out:
+                for batch in self.batches:
+                    fan_out.write(batch)
+        self.assertEqual(fan_out._threads, [])
+        self.assertTrue(os.path.exists(self.path('ok.csv')))
+
+    def test_needs_a_writer(self):
+        with self.assertRaises(ValueError):
+            FanOutWriter([])
+
+
+if __name__ == '__main__':
+    unittest.main()